@@ -7,7 +7,6 @@ This follows the LiveKit restaurant_agent.py pattern for reliable instruction fo
 """
 
 import base64
-import json
 import logging
 import os
 import shutil
@@ -17,6 +16,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
+import orjson
 from dotenv import load_dotenv
 from livekit import agents, rtc
 from livekit.agents import WorkerOptions, cli
@@ -108,7 +108,7 @@ def format_duration(seconds: float) -> str:
 async def send_to_frontend(room, data: dict):
     try:
         if room and hasattr(room, "local_participant") and room.local_participant:
-            payload = json.dumps(data).encode("utf-8")
+            payload = orjson.dumps(data)
             await room.local_participant.publish_data(payload, reliable=True)
     except Exception:
         pass
@@ -161,7 +161,7 @@ def extract_profile(transcript: list) -> dict:
             temperature=0,
             response_format={"type": "json_object"},
         )
-        return json.loads(response.choices[0].message.content)
+        return orjson.loads(response.choices[0].message.content)
     except Exception:
         return {}
 
@@ -402,7 +402,7 @@ async def entrypoint(ctx: agents.JobContext):
     print(f"[AGENT] Room metadata raw: {ctx.room.metadata[:500] if ctx.room.metadata else 'EMPTY'}")
     try:
         if ctx.room.metadata:
-            room_meta = json.loads(ctx.room.metadata)
+            room_meta = orjson.loads(ctx.room.metadata)
             briefing = room_meta.get("interview_briefing")
             plan = room_meta.get("interview_plan")
             print(
@@ -425,7 +425,7 @@ async def entrypoint(ctx: agents.JobContext):
     if briefing:
         # Try to get from metadata participant_name
         try:
-            room_meta = json.loads(ctx.room.metadata)
+            room_meta = orjson.loads(ctx.room.metadata)
             user_name = room_meta.get("participant_name", "there").split()[0]
         except Exception:
             pass
@@ -635,8 +635,7 @@ async def entrypoint(ctx: agents.JobContext):
             "extracted_profile": extracted_profile,
         }
 
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(metadata, f, indent=2, ensure_ascii=False)
+        json_path.write_bytes(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
 
         # --- Send session data to Langfuse ---
         try:
@@ -657,7 +656,7 @@ async def entrypoint(ctx: agents.JobContext):
                 # Resolve full participant name from room metadata
                 participant_full_name = user_name
                 try:
-                    _rm = json.loads(ctx.room.metadata) if ctx.room.metadata else {}
+                    _rm = orjson.loads(ctx.room.metadata) if ctx.room.metadata else {}
                     participant_full_name = _rm.get("participant_name", user_name)
                 except Exception:
                     pass
@@ -713,7 +712,7 @@ async def entrypoint(ctx: agents.JobContext):
     # Handle data channel messages (user notes)
     def on_data_received(data_packet: rtc.DataPacket):
         try:
-            message = json.loads(data_packet.data.decode("utf-8"))
+            message = orjson.loads(data_packet.data)
             if message.get("type") == "user_note":
                 note_text = message.get("text", "")
                 asyncio.create_task(process_user_note(note_text))
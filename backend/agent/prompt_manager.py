@@ -1,4 +1,6 @@
 import logging
+import re
+import time
 from functools import lru_cache
 from typing import Any
 
@@ -6,6 +8,10 @@ from core.clients import get_langfuse_client
 
 logger = logging.getLogger(__name__)
 
+LANGFUSE_PROMPT_TTL_SECONDS = 300
+
+_langfuse_prompts: dict[tuple[str, str], tuple[float, Any | None]] = {}
+
 
 @lru_cache(maxsize=1)
 def _langfuse():
@@ -13,36 +19,57 @@ def _langfuse():
 
 
 def get_prompt(name: str, *, fallback: str, label: str = "production", **variables) -> str:
+    # The Langfuse template is resolved once per TTL; only variable substitution runs per call.
+    prompt = get_langfuse_prompt(name, label=label)
+    template = getattr(prompt, "prompt", None)
+    if not isinstance(template, str):
+        template = fallback
+    if variables:
+        return _render(template, variables)
+    return template
+
+
+def get_langfuse_prompt(name: str, *, label: str = "production") -> Any | None:
     client = _langfuse()
     if client is None:
-        if variables:
-            return _compile_fallback(fallback, variables)
-        return fallback
+        return None
+
+    key = (name, label)
+    cached = _langfuse_prompts.get(key)
+    now = time.monotonic()
+    if cached and now - cached[0] < LANGFUSE_PROMPT_TTL_SECONDS:
+        return cached[1]
 
     try:
         prompt = client.get_prompt(name, label=label, type="text")
-        compiled = prompt.compile(**variables) if variables else prompt.compile()
         logger.info("Prompt '%s' fetched from Langfuse (version=%s)", name, prompt.version)
-        return compiled
     except Exception as e:
         logger.warning("Langfuse prompt '%s' unavailable (%s), using fallback", name, e)
-        if variables:
-            return _compile_fallback(fallback, variables)
-        return fallback
+        prompt = None
+    _langfuse_prompts[key] = (now, prompt)
+    return prompt
 
 
-def get_langfuse_prompt(name: str, *, label: str = "production") -> Any | None:
-    client = _langfuse()
-    if client is None:
-        return None
-    try:
-        return client.get_prompt(name, label=label, type="text")
-    except Exception:
-        return None
+def is_langfuse_prompt_cached(name: str, *, label: str = "production") -> bool:
+    if _langfuse() is None:
+        return True
+    cached = _langfuse_prompts.get((name, label))
+    return bool(cached) and time.monotonic() - cached[0] < LANGFUSE_PROMPT_TTL_SECONDS
+
+
+_PLACEHOLDER = re.compile(r"\{\{\s*([_a-z][_a-z0-9]*)\s*\}\}")
+
+
+@lru_cache(maxsize=128)
+def _segments(template: str) -> tuple[str, ...]:
+    # Alternating literal text and placeholder names: (literal, name, literal, ..., literal).
+    return tuple(_PLACEHOLDER.split(template))
 
 
-def _compile_fallback(template: str, variables: dict) -> str:
-    result = template
-    for key, value in variables.items():
-        result = result.replace("{{" + key + "}}", str(value))
-    return result
+def _render(template: str, variables: dict) -> str:
+    segments = _segments(template)
+    parts = list(segments)
+    for i in range(1, len(segments), 2):
+        name = segments[i]
+        parts[i] = str(variables[name]) if name in variables else f"{{{{{name}}}}}"
+    return "".join(parts)
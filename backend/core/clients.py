@@ -4,14 +4,28 @@ from functools import lru_cache
 from core.config import get_secret
 
 
+GEMINI_MAX_CONNECTIONS = 100
+OPENAI_MAX_CONNECTIONS = 100
+
+
 @lru_cache
 def get_gemini_client():
+    import httpx
     from google import genai
 
+    http_options = {
+        "async_client_args": {
+            "http2": True,
+            "limits": httpx.Limits(
+                max_connections=GEMINI_MAX_CONNECTIONS,
+                max_keepalive_connections=GEMINI_MAX_CONNECTIONS,
+            ),
+        },
+    }
     api_key = get_secret("gemini-api-key", "GEMINI_API_KEY")
     if api_key:
-        return genai.Client(api_key=api_key)
-    return genai.Client()
+        return genai.Client(api_key=api_key, http_options=http_options)
+    return genai.Client(http_options=http_options)
 
 
 @lru_cache
@@ -21,6 +35,23 @@ def get_openai_client():
     return OpenAI()
 
 
+@lru_cache
+def get_async_openai_client():
+    import httpx
+    from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+    return AsyncOpenAI(
+        http_client=DefaultAsyncHttpxClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=OPENAI_MAX_CONNECTIONS,
+                max_keepalive_connections=OPENAI_MAX_CONNECTIONS,
+            ),
+        )
+    )
+
+
+@lru_cache
 def get_langfuse_client():
     public_key = os.getenv("LANGFUSE_PUBLIC_KEY")
     secret_key = os.getenv("LANGFUSE_SECRET_KEY")
@@ -6,23 +6,40 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+@lru_cache
+def _secret_manager_client():
+    from google.cloud import secretmanager
+
+    return secretmanager.SecretManagerServiceClient()
+
+
+# Failed reads raise and are therefore not cached.
+@lru_cache
+def _access_secret(secret_id: str) -> str:
+    project_id = os.getenv("GOOGLE_CLOUD_PROJECT", "mbio-profile-creation")
+    name = f"projects/{project_id}/secrets/{secret_id}/versions/latest"
+    response = _secret_manager_client().access_secret_version(request={"name": name})
+    return response.payload.data.decode("UTF-8")
+
+
 def get_secret(secret_id: str, fallback_env: str | None = None) -> str | None:
     env_value = os.getenv(fallback_env or secret_id.upper().replace("-", "_"))
     if env_value:
         return env_value
 
     try:
-        from google.cloud import secretmanager
-
-        project_id = os.getenv("GOOGLE_CLOUD_PROJECT", "mbio-profile-creation")
-        client = secretmanager.SecretManagerServiceClient()
-        name = f"projects/{project_id}/secrets/{secret_id}/versions/latest"
-        response = client.access_secret_version(request={"name": name})
-        return response.payload.data.decode("UTF-8")
+        return _access_secret(secret_id)
     except Exception:
         return None
 
 
+LIVEKIT_SECRETS = (
+    ("livekit-url", "LIVEKIT_URL"),
+    ("livekit-api-key", "LIVEKIT_API_KEY"),
+    ("livekit-api-secret", "LIVEKIT_API_SECRET"),
+)
+
+
 @lru_cache
 def livekit_url() -> str:
     value = get_secret("livekit-url", "LIVEKIT_URL")
@@ -52,3 +69,6 @@ GCP_PROJECT = os.getenv("GOOGLE_CLOUD_PROJECT", "mbio-profile-creation")
 GCP_LOCATION = os.getenv("GOOGLE_CLOUD_LOCATION", "us-central1")
 STORAGE_DRIVER = os.getenv("STORAGE_DRIVER", "local")
 DATA_DIR = os.getenv("DATA_DIR", "/data")
+GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-2.0-flash")
+GEMINI_EMBEDDING_MODEL = os.getenv("GEMINI_EMBEDDING_MODEL", "text-embedding-004")
+GEMINI_CONCURRENCY = int(os.getenv("GEMINI_CONCURRENCY", "8"))
@@ -1,14 +1,16 @@
-import json
 import logging
 
+import orjson
+
 from core.clients import get_gemini_client
+from core.config import GEMINI_MODEL
 from core.extraction import convert_to_profile_format
 from agent.prompt_manager import get_prompt, get_langfuse_prompt
-from observability.tracing import traced_generation
+from observability.tracing import TRACE_TEXT_LIMIT, traced_generation, usage_details
 
 logger = logging.getLogger(__name__)
 
-MODEL = "gemini-2.0-flash"
+MODEL = GEMINI_MODEL
 
 _FALLBACK_ENHANCER_SYSTEM = """\
 You are an expert resume enhancer for M.bio.
@@ -191,7 +193,7 @@ def enhance_resume(
     profile_analysis: dict | None,
     basics_answers: dict | None,
 ) -> dict:
-    resume_json = json.dumps(resume_data, indent=2, ensure_ascii=False)
+    resume_json = orjson.dumps(resume_data, option=orjson.OPT_INDENT_2).decode()
 
     transcript_text = "\n".join(
         f"{'USER' if item.get('role') == 'user' else 'INTERVIEWER'}: {item.get('text', '')}"
@@ -199,7 +201,7 @@ def enhance_resume(
         if item.get("text")
     )
 
-    analysis_json = json.dumps(profile_analysis or {}, indent=2, ensure_ascii=False)
+    analysis_json = orjson.dumps(profile_analysis or {}, option=orjson.OPT_INDENT_2).decode()
 
     user_name = "Candidate"
     if basics_answers and basics_answers.get("name"):
@@ -227,7 +229,8 @@ def enhance_resume(
         "resume_enhancer",
         model=MODEL,
         prompt=lf_prompt,
-        input_data={"system": system_prompt[:500], "user": user_prompt[:2000]},
+        input_data={"system": system_prompt, "user": user_prompt},
+        input_limits={"system": 500, "user": TRACE_TEXT_LIMIT},
     ) as gen:
         client = get_gemini_client()
         contents = [
@@ -242,16 +245,12 @@ def enhance_resume(
             config={"temperature": 0.3, "response_mime_type": "application/json"},
         )
 
-        usage = getattr(response, "usage_metadata", None)
         gen.update(
             output=response.text,
-            usage_details={
-                "input": getattr(usage, "prompt_token_count", 0),
-                "output": getattr(usage, "candidates_token_count", 0),
-            } if usage else None,
+            usage_details=usage_details(response.usage_metadata),
         )
 
-    enhanced_extracted = json.loads(response.text)
+    enhanced_extracted = orjson.loads(response.text)
 
     if basics_answers:
         _merge_basics_into(enhanced_extracted, basics_answers)
@@ -1,6 +1,6 @@
-import json
+import orjson
 
-from core.clients import get_openai_client
+from core.clients import get_async_openai_client
 
 
 SIMPLE_EXTRACTION_PROMPT = """Extract structured profile information from this interview transcript.
@@ -113,7 +113,7 @@ IMPORTANT:
 Return ONLY valid JSON, no additional text."""
 
 
-def extract_profile_from_transcript(transcript: list[dict]) -> dict:
+async def extract_profile_from_transcript(transcript: list[dict]) -> dict:
     if not transcript:
         return {}
 
@@ -124,8 +124,8 @@ def extract_profile_from_transcript(transcript: list[dict]) -> dict:
     )
 
     try:
-        client = get_openai_client()
-        response = client.chat.completions.create(
+        client = get_async_openai_client()
+        response = await client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[
                 {"role": "system", "content": SIMPLE_EXTRACTION_PROMPT},
@@ -134,12 +134,12 @@ def extract_profile_from_transcript(transcript: list[dict]) -> dict:
             temperature=0,
             response_format={"type": "json_object"},
         )
-        return json.loads(response.choices[0].message.content)
+        return orjson.loads(response.choices[0].message.content)
     except Exception:
         return {}
 
 
-def extract_profile_features(
+async def extract_profile_features(
     transcript: list[dict],
     basics_answers: dict,
     model: str = "gpt-4o",
@@ -155,12 +155,12 @@ def extract_profile_features(
 
     prompt = DETAILED_EXTRACTION_PROMPT.format(
         transcript=transcript_text,
-        basics=json.dumps(basics_answers, indent=2),
+        basics=orjson.dumps(basics_answers, option=orjson.OPT_INDENT_2).decode(),
     )
 
     try:
-        client = get_openai_client()
-        response = client.chat.completions.create(
+        client = get_async_openai_client()
+        response = await client.chat.completions.create(
             model=model,
             messages=[
                 {
@@ -173,7 +173,7 @@ def extract_profile_features(
             response_format={"type": "json_object"},
         )
 
-        extracted = json.loads(response.choices[0].message.content)
+        extracted = orjson.loads(response.choices[0].message.content)
         _merge_basics(extracted, basics_answers)
         return extracted
     except Exception:
@@ -1,4 +1,3 @@
-from interview_prep.pipeline import run_interview_prep_pipeline
 from interview_prep.schemas import (
     InterviewPrepState,
     PositionConfig,
@@ -10,6 +9,7 @@ from interview_prep.schemas import (
 
 __all__ = [
     "run_interview_prep_pipeline",
+    "stream_interview_prep_pipeline",
     "InterviewPrepState",
     "PositionConfig",
     "TenantConfig",
@@ -17,3 +17,12 @@ __all__ = [
     "InterviewPlan",
     "InterviewBriefing",
 ]
+
+
+def __getattr__(name: str):
+    # Importing interview_prep.schemas (e.g. from tenants.loader) should not load the pipeline.
+    if name in ("run_interview_prep_pipeline", "stream_interview_prep_pipeline"):
+        from interview_prep import pipeline
+
+        return getattr(pipeline, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,9 +1,12 @@
-from interview_prep.agents.profile_analyzer import profile_analyzer_node
+from interview_prep.agents.profile_analyzer import profile_analyzer_batch, profile_analyzer_node
 from interview_prep.agents.question_planner import question_planner_node
 from interview_prep.agents.interview_briefer import interview_briefer_node
+from interview_prep.agents.analyzer_planner import analyzer_planner_node
 
 __all__ = [
     "profile_analyzer_node",
+    "profile_analyzer_batch",
     "question_planner_node",
     "interview_briefer_node",
+    "analyzer_planner_node",
 ]
@@ -0,0 +1,40 @@
+from typing import Any
+
+from observability.tracing import traced_node
+from interview_prep.agents.runner import AgentSpec, resume_json, run_agent
+from interview_prep.schemas import FusedAnalysisPlan, InterviewPrepState
+from interview_prep.prompts import get_analyzer_planner_system, get_analyzer_planner_user
+
+
+def _build_user_prompt(state: InterviewPrepState) -> str:
+    return get_analyzer_planner_user(
+        user_name=state["user_name"],
+        life_stage=state["life_stage"],
+        resume_json=resume_json(state),
+    )
+
+
+def _to_state_update(fused: FusedAnalysisPlan) -> dict[str, Any]:
+    return {
+        "profile_analysis": fused.profile_analysis,
+        "interview_plan": fused.interview_plan,
+        "life_stage": fused.profile_analysis.life_stage,
+    }
+
+
+ANALYZER_PLANNER = AgentSpec(
+    name="analyzer_planner",
+    label="Analyzer planner",
+    langfuse_prompt="pipeline/analyzer-planner-system",
+    schema=FusedAnalysisPlan,
+    temperature=0.4,
+    priming_text="I understand. I will analyze the resume and create a personalized interview plan tailored to this candidate.",
+    get_system_prompt=get_analyzer_planner_system,
+    build_user_prompt=_build_user_prompt,
+    to_state_update=_to_state_update,
+)
+
+
+@traced_node("analyzer_planner")
+async def analyzer_planner_node(state: InterviewPrepState) -> dict[str, Any]:
+    return await run_agent(ANALYZER_PLANNER, state)
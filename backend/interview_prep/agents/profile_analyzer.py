@@ -1,75 +1,187 @@
-import json
+import asyncio
 from typing import Any
 
-from core.clients import get_gemini_client
+import orjson
+from pydantic import TypeAdapter
+
 from agent.prompt_manager import get_langfuse_prompt
-from observability.tracing import traced_generation
-from interview_prep.schemas import InterviewPrepState, ProfileAnalysis
-from interview_prep.prompts import get_profile_analyzer_system, get_profile_analyzer_user
+from observability.tracing import traced_generation, traced_node, usage_details
+from interview_prep.agents.runner import (
+    MODEL,
+    AgentSpec,
+    json_response_config,
+    rejection_reason,
+    resume_json,
+    run_agent,
+)
+from interview_prep.cache import SemanticCache
+from interview_prep.context_cache import generate_with_cached_prefix
+from interview_prep.schemas import IndexedProfileAnalysis, InterviewPrepState, ProfileAnalysis
+from interview_prep.prompts import (
+    get_profile_analyzer_batch_user,
+    get_profile_analyzer_system,
+    get_profile_analyzer_user,
+    get_tenant_block,
+)
+
+# Resumes packed into one batched call; beyond ~8 candidates or ~8k tokens
+# per prompt the per-candidate analysis quality drops off.
+BATCH_MAX_CANDIDATES = 8
+BATCH_MAX_RESUME_CHARS = 32_000
+
+# Near-duplicate resumes (resubmissions, templated CVs) reuse a previous analysis.
+PROFILE_CACHE_SIMILARITY = 0.97
+PROFILE_CACHE_MAX_ENTRIES = 512
+PROFILE_CACHE_TTL_SECONDS = 24 * 3600
+
+_profile_analysis_list = TypeAdapter(list[IndexedProfileAnalysis])
+_profile_cache = SemanticCache(
+    threshold=PROFILE_CACHE_SIMILARITY,
+    max_entries=PROFILE_CACHE_MAX_ENTRIES,
+    ttl_seconds=PROFILE_CACHE_TTL_SECONDS,
+)
+
+
+def _build_user_prompt(state: InterviewPrepState) -> str:
+    return get_profile_analyzer_user(
+        user_name=state["user_name"],
+        life_stage=state["life_stage"],
+        resume_json=resume_json(state),
+    )
+
+
+def _to_state_update(analysis: ProfileAnalysis) -> dict[str, Any]:
+    return {
+        "profile_analysis": analysis,
+        "life_stage": analysis.life_stage,
+    }
+
+
+PROFILE_ANALYZER = AgentSpec(
+    name="profile_analyzer",
+    label="Profile analyzer",
+    langfuse_prompt="pipeline/profile-analyzer-system",
+    schema=ProfileAnalysis,
+    temperature=0.3,
+    priming_text="I understand. I will analyze the resume and provide structured insights for the voice interview.",
+    get_system_prompt=get_profile_analyzer_system,
+    build_user_prompt=_build_user_prompt,
+    to_state_update=_to_state_update,
+)
+
 
-MODEL = "gemini-2.0-flash"
+def _profile_cache_namespace(state: InterviewPrepState) -> str:
+    # Near-hits may only reuse an analysis of the same candidate (a resubmission),
+    # never of another person whose resume follows the same template.
+    basics = state["resume_data"].get("basics") or {}
+    identity = "\x00".join(
+        str(value or "").strip().lower()
+        for value in (state["user_name"], basics.get("name"), basics.get("email"))
+    )
+    tenant_block = get_tenant_block(PROFILE_ANALYZER.name, state.get("tenant_config"))
+    return f"{identity}\x00{state['life_stage']}\x00{tenant_block}"
 
 
-def profile_analyzer_node(state: InterviewPrepState) -> dict[str, Any]:
+@traced_node("profile_analyzer")
+async def profile_analyzer_node(state: InterviewPrepState) -> dict[str, Any]:
+    probe = await _profile_cache.lookup(_profile_cache_namespace(state), state["resume_data"])
+    if probe.value is not None:
+        return _to_state_update(probe.value)
+
+    update = await run_agent(PROFILE_ANALYZER, state)
+    if update.get("profile_analysis") is not None:
+        _profile_cache.store(probe, update["profile_analysis"])
+    return update
+
+
+def _batch_indices(resume_jsons: list[str]) -> list[list[int]]:
+    batches: list[list[int]] = []
+    current: list[int] = []
+    size = 0
+    for i, document in enumerate(resume_jsons):
+        if current and (
+            len(current) >= BATCH_MAX_CANDIDATES
+            or size + len(document) > BATCH_MAX_RESUME_CHARS
+        ):
+            batches.append(current)
+            current, size = [], 0
+        current.append(i)
+        size += len(document)
+    if current:
+        batches.append(current)
+    return batches
+
+
+async def _analyze_batch(
+    states: list[InterviewPrepState], resume_jsons: list[str]
+) -> list[dict[str, Any]]:
     try:
-        resume_json = json.dumps(state["resume_data"], indent=2, ensure_ascii=False)
-
-        tenant_block = ""
-        if state.get("tenant_config"):
-            tc = state["tenant_config"]
-            tenant_block = f"\n\n## Recruiter Focus\nFocus area: {tc.get('focus_area', 'General')}\nTone: {tc.get('tone', 'supportive')}"
-            if tc.get("custom_instructions"):
-                tenant_block += f"\nSpecial instructions: {tc['custom_instructions']}"
-            if tc.get("key_areas"):
-                tenant_block += f"\nKey areas to explore: {', '.join(tc['key_areas'])}"
-            if tc.get("must_verify"):
-                tenant_block += f"\nMust verify: {', '.join(tc['must_verify'])}"
-
-        user_prompt = get_profile_analyzer_user(
-            user_name=state["user_name"],
-            life_stage=state["life_stage"],
-            resume_json=resume_json,
-        ) + tenant_block
-
-        system_prompt = get_profile_analyzer_system()
-        contents = [
-            {"role": "user", "parts": [{"text": system_prompt}]},
-            {"role": "model", "parts": [{"text": "I understand. I will analyze the resume and provide structured insights for the voice interview."}]},
-            {"role": "user", "parts": [{"text": user_prompt}]},
+        candidates = [
+            {
+                "idx": i,
+                "user_name": state["user_name"],
+                "life_stage": state["life_stage"],
+                "resume": orjson.Fragment(document),
+            }
+            for i, (state, document) in enumerate(zip(states, resume_jsons))
         ]
-
-        lf_prompt = get_langfuse_prompt("pipeline/profile-analyzer-system")
+        user_prompt = get_profile_analyzer_batch_user(
+            candidates_json=orjson.dumps(candidates).decode()
+        ) + get_tenant_block(PROFILE_ANALYZER.name, states[0].get("tenant_config"))
+        system_prompt = PROFILE_ANALYZER.get_system_prompt()
 
         with traced_generation(
-            "profile_analyzer",
+            "profile_analyzer_batch",
             model=MODEL,
-            prompt=lf_prompt,
-            input_data={"system": system_prompt, "user": user_prompt[:2000]},
+            prompt=get_langfuse_prompt(PROFILE_ANALYZER.langfuse_prompt),
+            input_data={"system": system_prompt, "user": user_prompt},
         ) as gen:
-            client = get_gemini_client()
-            response = client.models.generate_content(
+            response = await generate_with_cached_prefix(
                 model=MODEL,
-                contents=contents,
-                config={"temperature": 0.3, "response_mime_type": "application/json"},
+                system_prompt=system_prompt,
+                priming_text=PROFILE_ANALYZER.priming_text,
+                user_prompt=user_prompt,
+                config=json_response_config(PROFILE_ANALYZER.temperature, _profile_analysis_list),
             )
 
-            usage = getattr(response, "usage_metadata", None)
             gen.update(
                 output=response.text,
-                usage_details={
-                    "input": getattr(usage, "prompt_token_count", 0),
-                    "output": getattr(usage, "candidates_token_count", 0),
-                } if usage else None,
+                usage_details=usage_details(response.usage_metadata),
             )
 
-        analysis = ProfileAnalysis(**json.loads(response.text))
+        rejection = rejection_reason(response)
+        if rejection:
+            raise ValueError(rejection)
 
-        return {
-            "profile_analysis": analysis.model_dump(),
-            "life_stage": analysis.life_stage,
-        }
+        # Match analyses to candidates by idx; the model may reorder entries.
+        analyses = _profile_analysis_list.validate_json(response.text)
+        by_idx = {analysis.idx: analysis for analysis in analyses}
+        if len(analyses) != len(states) or by_idx.keys() != set(range(len(states))):
+            raise ValueError(
+                f"expected one analysis per idx 0..{len(states) - 1}, "
+                f"got idx {[analysis.idx for analysis in analyses]}"
+            )
+        return [_to_state_update(by_idx[i].without_idx()) for i in range(len(states))]
 
-    except json.JSONDecodeError as e:
-        return {"errors": state.get("errors", []) + [f"Profile analyzer JSON error: {e}"]}
     except Exception as e:
-        return {"errors": state.get("errors", []) + [f"Profile analyzer error: {e}"]}
+        return [
+            {"errors": state.get("errors", []) + [f"Profile analyzer batch error: {e}"]}
+            for state in states
+        ]
+
+
+async def profile_analyzer_batch(states: list[InterviewPrepState]) -> list[dict[str, Any]]:
+    resume_jsons = [resume_json(state) for state in states]
+    batches = _batch_indices(resume_jsons)
+    results = await asyncio.gather(
+        *(
+            _analyze_batch([states[i] for i in batch], [resume_jsons[i] for i in batch])
+            for batch in batches
+        )
+    )
+
+    updates: list[dict[str, Any]] = [{} for _ in states]
+    for batch, batch_updates in zip(batches, results):
+        for i, update in zip(batch, batch_updates):
+            updates[i] = update
+    return updates
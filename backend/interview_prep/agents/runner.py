@@ -0,0 +1,165 @@
+import asyncio
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable
+
+import orjson
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from agent.prompt_manager import get_langfuse_prompt, is_langfuse_prompt_cached
+from core.config import GEMINI_MODEL
+from observability.tracing import traced_generation, usage_details
+from interview_prep.context_cache import GenerationResult, generate_with_cached_prefix
+from interview_prep.prompts import get_tenant_block
+from interview_prep.schemas import InterviewPrepState
+
+MODEL = GEMINI_MODEL
+RESPONSE_CACHE_TTL_SECONDS = 24 * 3600
+RESPONSE_CACHE_MAX_ENTRIES = 10_000
+# Send each agent's JSON schema as Gemini structured output (response_json_schema).
+STRUCTURED_OUTPUT = os.getenv("GEMINI_STRUCTURED_OUTPUT", "0") == "1"
+
+_BLOCKED_FINISH_REASONS = frozenset(
+    {"SAFETY", "RECITATION", "BLOCKLIST", "PROHIBITED_CONTENT", "SPII"}
+)
+
+_response_cache: OrderedDict[tuple[str, str, bytes], tuple[float, BaseModel]] = OrderedDict()
+
+
+@dataclass(frozen=True)
+class AgentSpec:
+    name: str
+    label: str
+    langfuse_prompt: str
+    schema: type[BaseModel]
+    temperature: float
+    priming_text: str
+    get_system_prompt: Callable[[], str]
+    build_user_prompt: Callable[[InterviewPrepState], str]
+    to_state_update: Callable[[Any], dict[str, Any]]
+    required_inputs: tuple[str, ...] = ()
+    missing_inputs_error: str = ""
+
+
+def resume_json(state: InterviewPrepState) -> str:
+    # The pipeline serializes the resume once up front; states built elsewhere may not carry it.
+    cached = state.get("resume_json")
+    if cached is not None:
+        return cached
+    return orjson.dumps(state["resume_data"]).decode()
+
+
+def state_json(value: BaseModel | dict) -> str:
+    if isinstance(value, BaseModel):
+        return value.model_dump_json()
+    return orjson.dumps(value).decode()
+
+
+@lru_cache(maxsize=None)
+def response_json_schema(schema: type[BaseModel] | TypeAdapter) -> dict:
+    if isinstance(schema, TypeAdapter):
+        return schema.json_schema()
+    return schema.model_json_schema()
+
+
+def json_response_config(temperature: float, schema: type[BaseModel] | TypeAdapter) -> dict:
+    config = {"temperature": temperature, "response_mime_type": "application/json"}
+    if STRUCTURED_OUTPUT:
+        config["response_json_schema"] = response_json_schema(schema)
+    return config
+
+
+def rejection_reason(response: GenerationResult) -> str | None:
+    if response.finish_reason in _BLOCKED_FINISH_REASONS:
+        return f"response blocked ({response.finish_reason})"
+    if not response.text:
+        return "empty response"
+    return None
+
+
+def _response_cache_key(name: str, system_prompt: str, user_prompt: str) -> tuple[str, str, bytes]:
+    digest = hashlib.blake2b(
+        f"{system_prompt}\x00{user_prompt}".encode(), digest_size=16
+    ).digest()
+    return name, MODEL, digest
+
+
+def _get_cached_response(key: tuple[str, str, bytes]) -> BaseModel | None:
+    entry = _response_cache.get(key)
+    if entry is None:
+        return None
+    expires_at, result = entry
+    if time.monotonic() > expires_at:
+        del _response_cache[key]
+        return None
+    _response_cache.move_to_end(key)
+    return result
+
+
+def _store_response(key: tuple[str, str, bytes], result: BaseModel) -> None:
+    _response_cache[key] = (time.monotonic() + RESPONSE_CACHE_TTL_SECONDS, result)
+    _response_cache.move_to_end(key)
+    while len(_response_cache) > RESPONSE_CACHE_MAX_ENTRIES:
+        _response_cache.popitem(last=False)
+
+
+async def _get_langfuse_prompt(name: str) -> Any | None:
+    # Only a cache miss does blocking I/O; skip the thread hop otherwise.
+    if is_langfuse_prompt_cached(name):
+        return get_langfuse_prompt(name)
+    return await asyncio.to_thread(get_langfuse_prompt, name)
+
+
+async def run_agent(spec: AgentSpec, state: InterviewPrepState) -> dict[str, Any]:
+    if not all(state.get(key) for key in spec.required_inputs):
+        return {"errors": state.get("errors", []) + [spec.missing_inputs_error]}
+
+    try:
+        # Each of these may be a blocking Langfuse prompt fetch; issue them together.
+        user_prompt, system_prompt, lf_prompt = await asyncio.gather(
+            asyncio.to_thread(spec.build_user_prompt, state),
+            asyncio.to_thread(spec.get_system_prompt),
+            _get_langfuse_prompt(spec.langfuse_prompt),
+        )
+        user_prompt += get_tenant_block(spec.name, state.get("tenant_config"))
+
+        cache_key = _response_cache_key(spec.name, system_prompt, user_prompt)
+        cached = _get_cached_response(cache_key)
+        if cached is not None:
+            return spec.to_state_update(cached)
+
+        with traced_generation(
+            spec.name,
+            model=MODEL,
+            prompt=lf_prompt,
+            input_data={"system": system_prompt, "user": user_prompt},
+        ) as gen:
+            response = await generate_with_cached_prefix(
+                model=MODEL,
+                system_prompt=system_prompt,
+                priming_text=spec.priming_text,
+                user_prompt=user_prompt,
+                config=json_response_config(spec.temperature, spec.schema),
+            )
+
+            gen.update(
+                output=response.text,
+                usage_details=usage_details(response.usage_metadata),
+            )
+
+        rejection = rejection_reason(response)
+        if rejection:
+            return {"errors": state.get("errors", []) + [f"{spec.label}: {rejection}"]}
+
+        result = spec.schema.model_validate_json(response.text)
+        _store_response(cache_key, result)
+        return spec.to_state_update(result)
+
+    except ValidationError as e:
+        return {"errors": state.get("errors", []) + [f"{spec.label} validation error: {e}"]}
+    except Exception as e:
+        return {"errors": state.get("errors", []) + [f"{spec.label} error: {e}"]}
@@ -0,0 +1,119 @@
+import asyncio
+import contextvars
+from bisect import bisect
+from typing import Any, Awaitable, Callable, Hashable
+
+from interview_prep.agents import profile_analyzer_batch, profile_analyzer_node
+from interview_prep.agents.profile_analyzer import BATCH_MAX_CANDIDATES, PROFILE_ANALYZER
+from interview_prep.agents.runner import resume_json
+from interview_prep.prompts import get_tenant_block
+from interview_prep.schemas import InterviewPrepState
+
+MAX_WAIT_MS = 25
+# Resume JSON size (chars) is the proxy for response length; a batch only waits for
+# its longest member, so short and long resumes are dispatched in separate batches.
+LENGTH_BUCKET_BOUNDS = (4_000, 12_000)
+
+StateUpdate = dict[str, Any]
+QueuedState = tuple[InterviewPrepState, asyncio.Future, contextvars.Context]
+
+
+class StageBatcher:
+    def __init__(
+        self,
+        run_one: Callable[[InterviewPrepState], Awaitable[StateUpdate]],
+        run_batch: Callable[[list[InterviewPrepState]], Awaitable[list[StateUpdate]]],
+        *,
+        max_batch: int,
+        max_wait_ms: float = MAX_WAIT_MS,
+        bucket_of: Callable[[InterviewPrepState], Hashable] | None = None,
+    ):
+        self._run_one = run_one
+        self._run_batch = run_batch
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._bucket_of = bucket_of
+        self._queue: asyncio.Queue | None = None
+        self._worker: asyncio.Task | None = None
+        self._dispatches: set[asyncio.Task] = set()
+
+    async def submit(self, state: InterviewPrepState) -> StateUpdate:
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            # The worker outlives the request that starts it; don't let it (or the
+            # dispatches it spawns) inherit that request's trace context.
+            self._worker = asyncio.create_task(self._collect(), context=contextvars.Context())
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((state, future, contextvars.copy_context()))
+        return await future
+
+    async def _collect(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                groups = self._split(batch)
+            except Exception as e:
+                self._fail(batch, e)
+                continue
+
+            # Keep collecting the next batch while this one is in flight.
+            for group in groups:
+                task = asyncio.create_task(self._dispatch(group))
+                self._dispatches.add(task)
+                task.add_done_callback(self._dispatches.discard)
+
+    def _split(self, batch: list[QueuedState]) -> list[list[QueuedState]]:
+        if self._bucket_of is None:
+            return [batch]
+        buckets: dict[Hashable, list] = {}
+        for item in batch:
+            buckets.setdefault(self._bucket_of(item[0]), []).append(item)
+        return list(buckets.values())
+
+    @staticmethod
+    def _fail(batch: list[QueuedState], error: Exception) -> None:
+        for _, future, _ in batch:
+            if not future.done():
+                future.set_exception(error)
+
+    async def _dispatch(self, batch: list[QueuedState]):
+        try:
+            if len(batch) == 1:
+                # A lone request runs in its submitter's context, so it is traced there.
+                state, _, context = batch[0]
+                updates = [await asyncio.create_task(self._run_one(state), context=context)]
+            else:
+                updates = await self._run_batch([state for state, _, _ in batch])
+        except Exception as e:
+            self._fail(batch, e)
+            return
+
+        for (_, future, _), update in zip(batch, updates):
+            if not future.done():
+                future.set_result(update)
+
+
+def profile_batch_key(state: InterviewPrepState) -> tuple[str, int]:
+    # A batched call carries a single tenant block, so only candidates whose tenant
+    # prompt is identical may share one; within a tenant, group by resume length.
+    tenant_block = get_tenant_block(PROFILE_ANALYZER.name, state.get("tenant_config"))
+    return tenant_block, bisect(LENGTH_BUCKET_BOUNDS, len(resume_json(state)))
+
+
+profile_analyzer_batcher = StageBatcher(
+    profile_analyzer_node,
+    profile_analyzer_batch,
+    max_batch=BATCH_MAX_CANDIDATES,
+    bucket_of=profile_batch_key,
+)
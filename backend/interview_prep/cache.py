@@ -0,0 +1,122 @@
+import asyncio
+import hashlib
+import logging
+import math
+import operator
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+import orjson
+
+from core.clients import get_gemini_client
+from core.config import GEMINI_EMBEDDING_MODEL
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_INPUT_MAX_CHARS = 8_000
+
+
+@dataclass
+class _Entry:
+    expires_at: float
+    embedding: tuple[float, ...] | None
+    value: Any
+
+
+@dataclass
+class CacheProbe:
+    namespace: str
+    digest: bytes
+    embedding: tuple[float, ...] | None
+    value: Any | None = None
+    document: bytes | None = None
+
+
+def canonical_json(data: Any) -> bytes:
+    return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+
+
+def _normalize(values) -> tuple[float, ...] | None:
+    norm = math.sqrt(sum(v * v for v in values))
+    if not norm:
+        return None
+    return tuple(v / norm for v in values)
+
+
+# Exact hits match the canonical JSON digest; otherwise the document embedding is
+# compared (cosine) against cached entries in the same namespace.
+class SemanticCache:
+    def __init__(self, *, threshold: float, max_entries: int, ttl_seconds: float):
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[tuple[str, bytes], _Entry] = OrderedDict()
+        self._backfills: set[asyncio.Task] = set()
+
+    async def _embed(self, document: bytes) -> tuple[float, ...] | None:
+        try:
+            result = await get_gemini_client().aio.models.embed_content(
+                model=GEMINI_EMBEDDING_MODEL,
+                contents=document[:EMBEDDING_INPUT_MAX_CHARS].decode(errors="ignore"),
+            )
+            return _normalize(result.embeddings[0].values)
+        except Exception as e:
+            logger.warning("Embedding unavailable (%s), semantic cache limited to exact hits", e)
+            return None
+
+    def _nearest(self, namespace: str, embedding: tuple[float, ...], now: float) -> Any | None:
+        best_score, best_key = self.threshold, None
+        for key, entry in self._entries.items():
+            if key[0] != namespace or entry.embedding is None or entry.expires_at < now:
+                continue
+            score = sum(map(operator.mul, embedding, entry.embedding))
+            if score >= best_score:
+                best_score, best_key = score, key
+        if best_key is None:
+            return None
+        self._entries.move_to_end(best_key)
+        return self._entries[best_key].value
+
+    def _has_namespace(self, namespace: str) -> bool:
+        return any(key[0] == namespace for key in self._entries)
+
+    async def _backfill_embedding(self, key: tuple[str, bytes], entry: _Entry, document: bytes):
+        embedding = await self._embed(document)
+        if self._entries.get(key) is entry:
+            entry.embedding = embedding
+
+    async def lookup(self, namespace: str, data: Any) -> CacheProbe:
+        document = canonical_json(data)
+        digest = hashlib.blake2b(document, digest_size=16).digest()
+        now = time.monotonic()
+
+        entry = self._entries.get((namespace, digest))
+        if entry is not None:
+            if entry.expires_at >= now:
+                self._entries.move_to_end((namespace, digest))
+                return CacheProbe(namespace, digest, entry.embedding, entry.value)
+            del self._entries[(namespace, digest)]
+
+        # Nothing to compare against: skip the embedding round trip on the request
+        # path and embed in the background once the entry is stored.
+        if not self._has_namespace(namespace):
+            return CacheProbe(namespace, digest, None, document=document)
+
+        embedding = await self._embed(document)
+        value = self._nearest(namespace, embedding, now) if embedding else None
+        return CacheProbe(namespace, digest, embedding, value, document)
+
+    def store(self, probe: CacheProbe, value: Any) -> None:
+        key = (probe.namespace, probe.digest)
+        entry = _Entry(time.monotonic() + self.ttl_seconds, probe.embedding, value)
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+        if entry.embedding is None and probe.document is not None:
+            task = asyncio.create_task(self._backfill_embedding(key, entry, probe.document))
+            self._backfills.add(task)
+            task.add_done_callback(self._backfills.discard)
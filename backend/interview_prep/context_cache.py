@@ -0,0 +1,154 @@
+import asyncio
+import hashlib
+import logging
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from google.genai import errors
+
+from core.clients import get_gemini_client
+from core.config import GEMINI_CONCURRENCY
+
+logger = logging.getLogger(__name__)
+
+CACHE_TTL = "3600s"
+# After a transient create failure, send the prefix inline until this has passed.
+CACHE_RETRY_SECONDS = 60
+
+_cache_names: dict[tuple[str, str], str | None] = {}
+_cache_retry_at: dict[tuple[str, str], float] = {}
+_cache_locks: dict[tuple[str, str], asyncio.Lock] = {}
+_gemini_semaphore = asyncio.Semaphore(GEMINI_CONCURRENCY)
+
+
+@dataclass
+class GenerationResult:
+    text: str
+    usage_metadata: Any | None = None
+    finish_reason: Any | None = None
+
+
+@lru_cache(maxsize=32)
+def _prefix_contents(system_prompt: str, priming_text: str) -> tuple[dict, dict]:
+    return (
+        {"role": "user", "parts": [{"text": system_prompt}]},
+        {"role": "model", "parts": [{"text": priming_text}]},
+    )
+
+
+def _cache_key(model: str, system_prompt: str, priming_text: str) -> tuple[str, str]:
+    digest = hashlib.sha256(f"{system_prompt}\x00{priming_text}".encode()).hexdigest()
+    return model, digest
+
+
+async def _get_cache_name(key: tuple[str, str], system_prompt: str, priming_text: str) -> str | None:
+    if key in _cache_names:
+        return _cache_names[key]
+    # Concurrent first calls for one prefix share a single create instead of each making a cache.
+    async with _cache_locks.setdefault(key, asyncio.Lock()):
+        if key in _cache_names:
+            return _cache_names[key]
+        return await _create_cache(key, system_prompt, priming_text)
+
+
+async def _create_cache(key: tuple[str, str], system_prompt: str, priming_text: str) -> str | None:
+    if time.monotonic() < _cache_retry_at.get(key, 0):
+        return None
+
+    try:
+        cache = await get_gemini_client().aio.caches.create(
+            model=key[0],
+            config={
+                "contents": list(_prefix_contents(system_prompt, priming_text)),
+                "ttl": CACHE_TTL,
+            },
+        )
+        _cache_names[key] = cache.name
+        _cache_retry_at.pop(key, None)
+        logger.info("Created Gemini context cache %s for model %s", cache.name, key[0])
+    except errors.ClientError as e:
+        if e.code != 400:
+            return _defer_cache_retry(key, e)
+        # Prefixes below the model's minimum cacheable size are rejected; send them inline.
+        logger.warning("Gemini context cache rejected (%s), sending prefix inline", e)
+        _cache_names[key] = None
+    except Exception as e:
+        return _defer_cache_retry(key, e)
+
+    return _cache_names[key]
+
+
+async def delete_context_caches() -> None:
+    names = [name for name in _cache_names.values() if name]
+    _cache_names.clear()
+    if not names:
+        return
+    client = get_gemini_client()
+    for name in names:
+        try:
+            await client.aio.caches.delete(name=name)
+        except Exception as e:
+            logger.warning("Failed to delete Gemini context cache %s: %s", name, e)
+
+
+def _defer_cache_retry(key: tuple[str, str], error: Exception) -> None:
+    logger.warning(
+        "Gemini context cache unavailable (%s), retrying in %ds", error, CACHE_RETRY_SECONDS
+    )
+    _cache_retry_at[key] = time.monotonic() + CACHE_RETRY_SECONDS
+    return None
+
+
+async def _generate_streamed(client, **kwargs) -> GenerationResult:
+    chunks: list[str] = []
+    usage = None
+    finish_reason = None
+    async for chunk in await client.aio.models.generate_content_stream(**kwargs):
+        if chunk.text:
+            chunks.append(chunk.text)
+        usage = chunk.usage_metadata or usage
+        if chunk.candidates:
+            finish_reason = chunk.candidates[0].finish_reason or finish_reason
+    return GenerationResult(
+        text="".join(chunks), usage_metadata=usage, finish_reason=finish_reason
+    )
+
+
+async def generate_with_cached_prefix(
+    *,
+    model: str,
+    system_prompt: str,
+    priming_text: str,
+    user_prompt: str,
+    config: dict,
+) -> GenerationResult:
+    client = get_gemini_client()
+    user_turn = {"role": "user", "parts": [{"text": user_prompt}]}
+    key = _cache_key(model, system_prompt, priming_text)
+
+    async with _gemini_semaphore:
+        for _ in range(2):
+            cache_name = await _get_cache_name(key, system_prompt, priming_text)
+            if not cache_name:
+                break
+            try:
+                return await _generate_streamed(
+                    client,
+                    model=model,
+                    contents=[user_turn],
+                    config={**config, "cached_content": cache_name},
+                )
+            except errors.ClientError as e:
+                if e.code != 404:
+                    raise
+                logger.info("Gemini context cache %s expired, recreating", cache_name)
+                _cache_names.pop(key, None)
+
+        return await _generate_streamed(
+            client,
+            model=model,
+            contents=[*_prefix_contents(system_prompt, priming_text), user_turn],
+            config=config,
+        )
@@ -1,23 +1,43 @@
-from langgraph.graph import StateGraph, END
+import os
+import time
+from functools import lru_cache
+from typing import TYPE_CHECKING, AsyncIterator
+
+import orjson
+from pydantic import BaseModel
 
 from interview_prep.schemas import InterviewPrepState
-from interview_prep.agents import (
-    profile_analyzer_node,
-    question_planner_node,
-    interview_briefer_node,
-)
+from observability.tracing import PipelineTrace
+from tenants.loader import load_tenant, resolve_position
+
+if TYPE_CHECKING:
+    from langgraph.graph import StateGraph
+
+# The graph is strictly linear, so by default it runs as plain function calls;
+# set LANGGRAPH_FAST_PATH=0 to execute through the compiled LangGraph instead.
+LANGGRAPH_FAST_PATH = os.getenv("LANGGRAPH_FAST_PATH", "1") == "1"
+# Group concurrent requests' profile analysis into batched LLM calls (direct path only).
+PROFILE_BATCHING = os.getenv("PROFILE_BATCHING", "0") == "1"
+# Produce the profile analysis and the interview plan in one LLM call over the resume.
+FUSED_ANALYZER_PLANNER = os.getenv("FUSED_ANALYZER_PLANNER", "0") == "1"
+
+_OUTPUT_KEYS = ("profile_analysis", "interview_plan", "interview_briefing")
+
+# Resolved tenant configs are reused for this long; clear _tenant_configs to pick up edits sooner.
+TENANT_CONFIG_TTL_SECONDS = 300
 
+_tenant_configs: dict[tuple[str, str | None], tuple[float, dict]] = {}
 
-def should_continue_to_planner(state: InterviewPrepState) -> str:
-    if state.get("profile_analysis"):
-        return "continue"
-    return "end_with_error"
 
+def _continue_if_present(key: str):
+    def router(state: InterviewPrepState) -> str:
+        return "continue" if state.get(key) else "end_with_error"
 
-def should_continue_to_briefer(state: InterviewPrepState) -> str:
-    if state.get("interview_plan"):
-        return "continue"
-    return "end_with_error"
+    return router
+
+
+should_continue_to_planner = _continue_if_present("profile_analysis")
+should_continue_to_briefer = _continue_if_present("interview_plan")
 
 
 def error_handler_node(state: InterviewPrepState) -> dict:
@@ -37,23 +57,63 @@ def error_handler_node(state: InterviewPrepState) -> dict:
     }
 
 
-def build_interview_prep_graph() -> StateGraph:
+def _get_tenant_config(tenant_id: str, position_id: str | None) -> dict:
+    key = (tenant_id, position_id)
+    cached = _tenant_configs.get(key)
+    now = time.monotonic()
+    if cached and now - cached[0] < TENANT_CONFIG_TTL_SECONDS:
+        return cached[1]
+
+    tenant_config = resolve_position(load_tenant(tenant_id), position_id)
+    _tenant_configs[key] = (now, tenant_config)
+    return tenant_config
+
+
+def _as_dict(value):
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    return value
+
+
+def _agent_nodes():
+    from interview_prep.agents import (
+        profile_analyzer_node,
+        question_planner_node,
+        interview_briefer_node,
+    )
+
+    return profile_analyzer_node, question_planner_node, interview_briefer_node
+
+
+def build_interview_prep_graph() -> "StateGraph":
+    from langgraph.graph import StateGraph, END
+
+    profile_analyzer_node, question_planner_node, interview_briefer_node = _agent_nodes()
+
     workflow = StateGraph(InterviewPrepState)
 
-    workflow.add_node("profile_analyzer", profile_analyzer_node)
-    workflow.add_node("question_planner", question_planner_node)
     workflow.add_node("interview_briefer", interview_briefer_node)
     workflow.add_node("error_handler", error_handler_node)
 
-    workflow.set_entry_point("profile_analyzer")
+    if FUSED_ANALYZER_PLANNER:
+        from interview_prep.agents import analyzer_planner_node
+
+        workflow.add_node("analyzer_planner", analyzer_planner_node)
+        workflow.set_entry_point("analyzer_planner")
+        plan_node = "analyzer_planner"
+    else:
+        workflow.add_node("profile_analyzer", profile_analyzer_node)
+        workflow.add_node("question_planner", question_planner_node)
+        workflow.set_entry_point("profile_analyzer")
+        workflow.add_conditional_edges(
+            "profile_analyzer",
+            should_continue_to_planner,
+            {"continue": "question_planner", "end_with_error": "error_handler"},
+        )
+        plan_node = "question_planner"
 
     workflow.add_conditional_edges(
-        "profile_analyzer",
-        should_continue_to_planner,
-        {"continue": "question_planner", "end_with_error": "error_handler"},
-    )
-    workflow.add_conditional_edges(
-        "question_planner",
+        plan_node,
         should_continue_to_briefer,
         {"continue": "interview_briefer", "end_with_error": "error_handler"},
     )
@@ -64,68 +124,156 @@ def build_interview_prep_graph() -> StateGraph:
     return workflow
 
 
-_compiled_graph = None
+# The graph's shape doesn't depend on the tenant (tenant config travels in the state),
+# so one compiled graph serves every request.
+@lru_cache
+def get_compiled_graph():
+    return build_interview_prep_graph().compile()
 
 
-def get_compiled_graph():
-    global _compiled_graph
-    if _compiled_graph is None:
-        workflow = build_interview_prep_graph()
-        _compiled_graph = workflow.compile()
-    return _compiled_graph
+def __getattr__(name: str):
+    # LangGraph Studio loads `interview_prep.pipeline:graph`; build it on first access.
+    if name == "graph":
+        return get_compiled_graph()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-graph = get_compiled_graph()
+async def iter_pipeline_direct(state: InterviewPrepState) -> AsyncIterator[dict]:
+    profile_analyzer_node, question_planner_node, interview_briefer_node = _agent_nodes()
 
+    if FUSED_ANALYZER_PLANNER:
+        from interview_prep.agents import analyzer_planner_node
 
-async def run_interview_prep_pipeline(
+        update = await analyzer_planner_node(state)
+        state.update(update)
+        yield update
+    else:
+        if PROFILE_BATCHING:
+            from interview_prep.batch_runner import profile_analyzer_batcher
+
+            update = await profile_analyzer_batcher.submit(state)
+        else:
+            update = await profile_analyzer_node(state)
+        state.update(update)
+        yield update
+
+        if should_continue_to_planner(state) != "continue":
+            update = error_handler_node(state)
+            state.update(update)
+            yield update
+            return
+
+        update = await question_planner_node(state)
+        state.update(update)
+        yield update
+
+    if should_continue_to_briefer(state) != "continue":
+        update = error_handler_node(state)
+    else:
+        update = await interview_briefer_node(state)
+    state.update(update)
+    yield update
+
+
+async def run_pipeline_direct(state: InterviewPrepState) -> InterviewPrepState:
+    async for _ in iter_pipeline_direct(state):
+        pass
+    return state
+
+
+def _start_pipeline(
     resume_data: dict,
     life_stage: str,
     user_name: str,
-    tenant_id: str | None = None,
-    position_id: str | None = None,
-    session_id: str | None = None,
-) -> dict:
-    from observability.tracing import PipelineTrace
-    from tenants.loader import load_tenant, resolve_position
-
+    tenant_id: str | None,
+    position_id: str | None,
+    session_id: str | None,
+) -> tuple[PipelineTrace, InterviewPrepState]:
     tenant_config = None
     if tenant_id:
-        tenant = load_tenant(tenant_id)
-        tenant_config = resolve_position(tenant, position_id)
+        tenant_config = _get_tenant_config(tenant_id, position_id)
 
-    with PipelineTrace(
+    trace = PipelineTrace(
         pipeline_name="interview_prep",
         user_name=user_name,
         life_stage=life_stage,
         session_id=session_id,
         metadata={
-            "resume_sections": list(resume_data.keys()),
+            "resume_sections": list(resume_data),
             "tenant_id": tenant_id,
         },
-    ) as trace:
-        initial_state: InterviewPrepState = {
-            "resume_data": resume_data,
-            "life_stage": life_stage,
-            "user_name": user_name,
-            "tenant_config": tenant_config,
-            "profile_analysis": None,
-            "interview_plan": None,
-            "interview_briefing": None,
-            "errors": [],
-        }
+    )
+    initial_state: InterviewPrepState = {
+        "resume_data": resume_data,
+        "resume_json": orjson.dumps(resume_data).decode(),
+        "life_stage": life_stage,
+        "user_name": user_name,
+        "tenant_config": tenant_config,
+        "errors": [],
+    }
+    return trace, initial_state
 
-        compiled = get_compiled_graph()
 
-        import asyncio
-        final_state = await asyncio.to_thread(compiled.invoke, initial_state)
+async def run_interview_prep_pipeline(
+    resume_data: dict,
+    life_stage: str,
+    user_name: str,
+    tenant_id: str | None = None,
+    position_id: str | None = None,
+    session_id: str | None = None,
+) -> dict:
+    trace, initial_state = _start_pipeline(
+        resume_data, life_stage, user_name, tenant_id, position_id, session_id
+    )
+
+    with trace:
+        if LANGGRAPH_FAST_PATH:
+            final_state = await run_pipeline_direct(initial_state)
+        else:
+            final_state = await get_compiled_graph().ainvoke(initial_state)
 
         trace_id = trace.session_id
 
     return {
-        "interview_briefing": final_state.get("interview_briefing"),
-        "profile_analysis": final_state.get("profile_analysis"),
-        "interview_plan": final_state.get("interview_plan"),
+        "interview_briefing": _as_dict(final_state.get("interview_briefing")),
+        "profile_analysis": _as_dict(final_state.get("profile_analysis")),
+        "interview_plan": _as_dict(final_state.get("interview_plan")),
         "errors": final_state.get("errors", []),
         "trace_id": trace_id,
     }
+
+
+async def stream_interview_prep_pipeline(
+    resume_data: dict,
+    life_stage: str,
+    user_name: str,
+    tenant_id: str | None = None,
+    position_id: str | None = None,
+    session_id: str | None = None,
+) -> AsyncIterator[dict]:
+    trace, state = _start_pipeline(
+        resume_data, life_stage, user_name, tenant_id, position_id, session_id
+    )
+
+    with trace:
+        if LANGGRAPH_FAST_PATH:
+            updates = iter_pipeline_direct(state)
+        else:
+            updates = _iter_graph_updates(get_compiled_graph(), state)
+
+        async for update in updates:
+            for key in _OUTPUT_KEYS:
+                if update.get(key) is not None:
+                    yield {"stage": key, "data": _as_dict(update[key])}
+
+        trace_id = trace.session_id
+
+    yield {"stage": "done", "errors": state.get("errors", []), "trace_id": trace_id}
+
+
+async def _iter_graph_updates(compiled, state: InterviewPrepState) -> AsyncIterator[dict]:
+    async for step in compiled.astream(state, stream_mode="updates"):
+        for update in step.values():
+            if update:
+                state.update(update)
+                yield update
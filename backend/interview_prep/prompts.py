@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from agent.prompt_manager import get_prompt
 
 _FALLBACK_PROFILE_ANALYZER_SYSTEM = """You are an expert profile analyst for M.bio, a platform that creates professional profiles through voice interviews.
@@ -23,17 +25,35 @@ Life Stage Detection:
 
 Output your analysis in the exact JSON format specified."""
 
-_FALLBACK_PROFILE_ANALYZER_USER = """Analyze this resume and provide insights for personalizing their voice interview.
+# User prompts keep the static instructions first and the per-candidate data last, so
+# requests share the longest possible prefix for the provider's implicit prompt caching.
+_FALLBACK_PROFILE_ANALYZER_USER = """Analyze the resume below and provide insights for personalizing the candidate's voice interview.
+
+Provide your analysis as a JSON object with these fields:
+- life_stage: "student" or "professional" (confirm or correct based on resume)
+- domain: detected professional domain (e.g., "Software Engineering", "Finance")
+- profile_summary: Brief 2-3 sentence summary of who they are
+- strengths: Array of {area, evidence[], confidence}
+- gaps: Array of {area, reason, priority}
+- interesting_hooks: Array of {topic, reason, suggested_angle}
+- soft_skills_inference: Array of {skill, evidence, confidence}
+- key_experiences: Array of notable experiences to reference
+- avoid_topics: Topics well-covered in resume (don't need to ask about)
 
+=== Candidate ===
 Candidate Name: {{user_name}}
 Declared Life Stage: {{life_stage}}
 
 Resume Data:
 ```json
 {{resume_json}}
-```
+```"""
 
-Provide your analysis as a JSON object with these fields:
+_FALLBACK_PROFILE_ANALYZER_BATCH_USER = """Analyze each of the resumes below and provide insights for personalizing each candidate's voice interview.
+
+Return a JSON array with exactly one analysis per candidate, in the same order as the input.
+Each analysis is a JSON object with these fields:
+- idx: the candidate's idx from the input
 - life_stage: "student" or "professional" (confirm or correct based on resume)
 - domain: detected professional domain (e.g., "Software Engineering", "Finance")
 - profile_summary: Brief 2-3 sentence summary of who they are
@@ -42,7 +62,13 @@ Provide your analysis as a JSON object with these fields:
 - interesting_hooks: Array of {topic, reason, suggested_angle}
 - soft_skills_inference: Array of {skill, evidence, confidence}
 - key_experiences: Array of notable experiences to reference
-- avoid_topics: Topics well-covered in resume (don't need to ask about)"""
+- avoid_topics: Topics well-covered in resume (don't need to ask about)
+
+=== Candidates ===
+Each with idx, user_name, declared life_stage and resume:
+```json
+{{candidates_json}}
+```"""
 
 
 _FALLBACK_QUESTION_PLANNER_SYSTEM = """You are an expert interview designer for M.bio, creating personalized voice interview questions.
@@ -75,15 +101,7 @@ For Professionals:
 
 Output your interview plan in the exact JSON format specified."""
 
-_FALLBACK_QUESTION_PLANNER_USER = """Create a personalized interview plan for this candidate.
-
-Profile Analysis:
-```json
-{{profile_analysis_json}}
-```
-
-Candidate Name: {{user_name}}
-Life Stage: {{life_stage}}
+_FALLBACK_QUESTION_PLANNER_USER = """Create a personalized interview plan for the candidate below.
 
 Create an interview plan as a JSON object with:
 - total_estimated_duration: string (e.g., "8-10 min")
@@ -91,7 +109,16 @@ Create an interview plan as a JSON object with:
   - Each question: {id, question, intent, priority, follow_up_if?, follow_up_question?, context_from_resume?}
 - adaptive_notes: Array of tips for adapting during the interview
 
-Generate 6-10 questions total, distributed across the phases. Make them specific to THIS candidate."""
+Generate 6-10 questions total, distributed across the phases. Make them specific to THIS candidate.
+
+=== Candidate ===
+Candidate Name: {{user_name}}
+Life Stage: {{life_stage}}
+
+Profile Analysis:
+```json
+{{profile_analysis_json}}
+```"""
 
 
 _FALLBACK_INTERVIEW_BRIEFER_SYSTEM = """You are an expert at preparing AI voice agents for personalized interviews.
@@ -122,6 +149,16 @@ Output the briefing in the exact JSON format specified."""
 
 _FALLBACK_INTERVIEW_BRIEFER_USER = """Create a complete interview briefing for the voice agent.
 
+Create an interview briefing as a JSON object with:
+- candidate_context: A paragraph the agent can use to understand who they're talking to
+- conversation_guidelines: How the agent should conduct the conversation
+- questions_script: Array of {question, notes, transition_to_next?}
+- topics_to_avoid: Array of topics to skip
+- personalization_hints: Array of specific ways to personalize (e.g., "mention their project X")
+
+Make this briefing feel like you're preparing a thoughtful human interviewer for this specific candidate.
+
+=== Candidate ===
 Candidate Name: {{user_name}}
 Life Stage: {{life_stage}}
 
@@ -133,16 +170,106 @@ Profile Analysis:
 Interview Plan:
 ```json
 {{interview_plan_json}}
-```
+```"""
 
-Create an interview briefing as a JSON object with:
-- candidate_context: A paragraph the agent can use to understand who they're talking to
-- conversation_guidelines: How the agent should conduct the conversation
-- questions_script: Array of {question, notes, transition_to_next?}
-- topics_to_avoid: Array of topics to skip
-- personalization_hints: Array of specific ways to personalize (e.g., "mention their project X")
 
-Make this briefing feel like you're preparing a thoughtful human interviewer for this specific candidate."""
+_FALLBACK_ANALYZER_PLANNER_SYSTEM = f"""{_FALLBACK_PROFILE_ANALYZER_SYSTEM}
+
+---
+
+{_FALLBACK_QUESTION_PLANNER_SYSTEM}
+
+You will do both tasks in a single response: first analyze the profile, then design the interview plan from that analysis."""
+
+_FALLBACK_ANALYZER_PLANNER_USER = """Analyze the resume below, then create a personalized interview plan for the candidate based on your analysis.
+
+Return a single JSON object with two fields:
+- profile_analysis: a JSON object with these fields:
+  - life_stage: "student" or "professional" (confirm or correct based on resume)
+  - domain: detected professional domain (e.g., "Software Engineering", "Finance")
+  - profile_summary: Brief 2-3 sentence summary of who they are
+  - strengths: Array of {area, evidence[], confidence}
+  - gaps: Array of {area, reason, priority}
+  - interesting_hooks: Array of {topic, reason, suggested_angle}
+  - soft_skills_inference: Array of {skill, evidence, confidence}
+  - key_experiences: Array of notable experiences to reference
+  - avoid_topics: Topics well-covered in resume (don't need to ask about)
+- interview_plan: a JSON object with:
+  - total_estimated_duration: string (e.g., "8-10 min")
+  - phases: Array of {phase_name, phase_goal, estimated_duration, questions[]}
+    - Each question: {id, question, intent, priority, follow_up_if?, follow_up_question?, context_from_resume?}
+  - adaptive_notes: Array of tips for adapting during the interview
+
+Generate 6-10 questions total, distributed across the phases. Make them specific to THIS candidate.
+
+=== Candidate ===
+Candidate Name: {{user_name}}
+Declared Life Stage: {{life_stage}}
+
+Resume Data:
+```json
+{{resume_json}}
+```"""
+
+
+LIFE_STAGES = ("student", "recent_grad", "professional")
+
+
+def _by_life_stage(template: str) -> dict[str, str]:
+    return {stage: template.replace("{{life_stage}}", stage) for stage in LIFE_STAGES}
+
+
+_PROFILE_ANALYZER_USER_BY_STAGE = _by_life_stage(_FALLBACK_PROFILE_ANALYZER_USER)
+_QUESTION_PLANNER_USER_BY_STAGE = _by_life_stage(_FALLBACK_QUESTION_PLANNER_USER)
+_INTERVIEW_BRIEFER_USER_BY_STAGE = _by_life_stage(_FALLBACK_INTERVIEW_BRIEFER_USER)
+_ANALYZER_PLANNER_USER_BY_STAGE = _by_life_stage(_FALLBACK_ANALYZER_PLANNER_USER)
+
+
+_TENANT_BLOCK_HEADERS = {
+    "profile_analyzer": "## Recruiter Focus\nFocus area: {focus_area}\nTone: {tone}",
+    "question_planner": "## Recruiter Requirements\nFocus area: {focus_area}\nTone: {tone}",
+    "analyzer_planner": "## Recruiter Requirements\nFocus area: {focus_area}\nTone: {tone}",
+    "interview_briefer": "## Recruiter Tone & Style\nTone: {tone}\nFocus: {focus_area}",
+}
+
+_TENANT_INSTRUCTIONS_LABELS = {
+    "profile_analyzer": "Special instructions",
+    "question_planner": "Special instructions",
+    "analyzer_planner": "Special instructions",
+    "interview_briefer": "Custom instructions",
+}
+
+
+@lru_cache(maxsize=256)
+def _render_tenant_block(
+    agent: str,
+    tone: str,
+    focus_area: str,
+    custom_instructions: str | None,
+    key_areas: tuple[str, ...],
+    must_verify: tuple[str, ...],
+) -> str:
+    block = "\n\n" + _TENANT_BLOCK_HEADERS[agent].format(focus_area=focus_area, tone=tone)
+    if custom_instructions:
+        block += f"\n{_TENANT_INSTRUCTIONS_LABELS[agent]}: {custom_instructions}"
+    if key_areas:
+        block += f"\nKey areas to explore: {', '.join(key_areas)}"
+    if must_verify:
+        block += f"\nMust verify: {', '.join(must_verify)}"
+    return block
+
+
+def get_tenant_block(agent: str, tenant_config: dict | None) -> str:
+    if not tenant_config:
+        return ""
+    return _render_tenant_block(
+        agent,
+        tenant_config.get("tone", "supportive"),
+        tenant_config.get("focus_area", "General"),
+        tenant_config.get("custom_instructions"),
+        tuple(tenant_config.get("key_areas") or ()),
+        tuple(tenant_config.get("must_verify") or ()),
+    )
 
 
 def get_profile_analyzer_system() -> str:
@@ -155,13 +282,21 @@ def get_profile_analyzer_system() -> str:
 def get_profile_analyzer_user(*, user_name: str, life_stage: str, resume_json: str) -> str:
     return get_prompt(
         "pipeline/profile-analyzer-user",
-        fallback=_FALLBACK_PROFILE_ANALYZER_USER,
+        fallback=_PROFILE_ANALYZER_USER_BY_STAGE.get(life_stage, _FALLBACK_PROFILE_ANALYZER_USER),
         user_name=user_name,
         life_stage=life_stage,
         resume_json=resume_json,
     )
 
 
+def get_profile_analyzer_batch_user(*, candidates_json: str) -> str:
+    return get_prompt(
+        "pipeline/profile-analyzer-batch-user",
+        fallback=_FALLBACK_PROFILE_ANALYZER_BATCH_USER,
+        candidates_json=candidates_json,
+    )
+
+
 def get_question_planner_system() -> str:
     return get_prompt(
         "pipeline/question-planner-system",
@@ -174,7 +309,7 @@ def get_question_planner_user(
 ) -> str:
     return get_prompt(
         "pipeline/question-planner-user",
-        fallback=_FALLBACK_QUESTION_PLANNER_USER,
+        fallback=_QUESTION_PLANNER_USER_BY_STAGE.get(life_stage, _FALLBACK_QUESTION_PLANNER_USER),
         profile_analysis_json=profile_analysis_json,
         user_name=user_name,
         life_stage=life_stage,
@@ -197,9 +332,26 @@ def get_interview_briefer_user(
 ) -> str:
     return get_prompt(
         "pipeline/interview-briefer-user",
-        fallback=_FALLBACK_INTERVIEW_BRIEFER_USER,
+        fallback=_INTERVIEW_BRIEFER_USER_BY_STAGE.get(life_stage, _FALLBACK_INTERVIEW_BRIEFER_USER),
         user_name=user_name,
         life_stage=life_stage,
         profile_analysis_json=profile_analysis_json,
         interview_plan_json=interview_plan_json,
     )
+
+
+def get_analyzer_planner_system() -> str:
+    return get_prompt(
+        "pipeline/analyzer-planner-system",
+        fallback=_FALLBACK_ANALYZER_PLANNER_SYSTEM,
+    )
+
+
+def get_analyzer_planner_user(*, user_name: str, life_stage: str, resume_json: str) -> str:
+    return get_prompt(
+        "pipeline/analyzer-planner-user",
+        fallback=_ANALYZER_PLANNER_USER_BY_STAGE.get(life_stage, _FALLBACK_ANALYZER_PLANNER_USER),
+        user_name=user_name,
+        life_stage=life_stage,
+        resume_json=resume_json,
+    )
@@ -1,21 +1,31 @@
-from typing import TypedDict, List, Optional, Literal
+import sys
+from typing import TypedDict, List, NotRequired, Optional, Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+Level = Literal["high", "medium", "low"]
+LifeStage = Literal["student", "professional"]
+Tone = Literal["formal", "casual", "direct", "supportive"]
 
-class StrengthItem(BaseModel):
+
+class _PipelineModel(BaseModel):
+    # LLM output models are only needed once a pipeline runs; build their validators then.
+    model_config = ConfigDict(defer_build=True)
+
+
+class StrengthItem(_PipelineModel):
     area: str = Field(description="The skill or strength area")
     evidence: List[str] = Field(description="Evidence from resume supporting this strength")
-    confidence: Literal["high", "medium", "low"] = Field(default="medium")
+    confidence: Level = Field(default="medium")
 
 
-class GapItem(BaseModel):
+class GapItem(_PipelineModel):
     area: str = Field(description="The area where information is missing")
     reason: str = Field(description="Why this is important to explore")
-    priority: Literal["high", "medium", "low"] = Field(default="medium")
+    priority: Level = Field(default="medium")
 
 
-class InterestingHook(BaseModel):
+class InterestingHook(_PipelineModel):
     topic: str = Field(description="The interesting topic to explore")
     reason: str = Field(description="Why this is interesting")
     suggested_angle: Optional[str] = Field(default=None)
@@ -33,20 +43,20 @@ class PositionConfig(BaseModel):
 class TenantConfig(BaseModel):
     tenant_id: str
     company_name: str
-    tone: Literal["formal", "casual", "direct", "supportive"] = Field(default="supportive")
+    tone: Tone = Field(default="supportive")
     industry: str | None = None
     description: str | None = None
     positions: list[PositionConfig] = Field(default_factory=list)
 
 
-class SoftSkillItem(BaseModel):
+class SoftSkillItem(_PipelineModel):
     skill: str
     evidence: str
-    confidence: Literal["high", "medium", "low"] = Field(default="medium")
+    confidence: Level = Field(default="medium")
 
 
-class ProfileAnalysis(BaseModel):
-    life_stage: Literal["student", "professional"]
+class ProfileAnalysis(_PipelineModel):
+    life_stage: LifeStage
     domain: str = Field(description="Detected professional domain")
     profile_summary: str
     strengths: List[StrengthItem] = Field(default_factory=list)
@@ -59,12 +69,22 @@ class ProfileAnalysis(BaseModel):
     @field_validator("key_experiences", "avoid_topics", mode="before")
     @classmethod
     def coerce_to_strings(cls, v):
-        if not isinstance(v, list):
+        if not isinstance(v, list) or all(type(item) is str for item in v):
             return v
-        return [str(item) if not isinstance(item, str) else item for item in v]
+        return [item if isinstance(item, str) else str(item) for item in v]
+
+
+class IndexedProfileAnalysis(ProfileAnalysis):
+    idx: int = Field(description="The candidate's idx from the batch input")
+
+    def without_idx(self) -> ProfileAnalysis:
+        return ProfileAnalysis.model_construct(
+            self.model_fields_set - {"idx"},
+            **{name: getattr(self, name) for name in ProfileAnalysis.model_fields},
+        )
 
 
-class QuestionItem(BaseModel):
+class QuestionItem(_PipelineModel):
     id: str | int
     question: str
     intent: str
@@ -73,6 +93,11 @@ class QuestionItem(BaseModel):
     follow_up_question: Optional[str] = Field(default=None)
     context_from_resume: Optional[str | bool] = Field(default=None)
 
+    @field_validator("priority")
+    @classmethod
+    def intern_priority(cls, v: str) -> str:
+        return sys.intern(v)
+
     @field_validator("context_from_resume", mode="before")
     @classmethod
     def coerce_context(cls, v):
@@ -85,20 +110,30 @@ class QuestionItem(BaseModel):
         return str(self.id)
 
 
-class InterviewPhase(BaseModel):
+class InterviewPhase(_PipelineModel):
     phase_name: str
     phase_goal: str
     estimated_duration: str
     questions: List[QuestionItem] = Field(default_factory=list)
 
+    @field_validator("phase_name")
+    @classmethod
+    def intern_phase_name(cls, v: str) -> str:
+        return sys.intern(v)
+
 
-class InterviewPlan(BaseModel):
+class InterviewPlan(_PipelineModel):
     total_estimated_duration: str
     phases: List[InterviewPhase] = Field(default_factory=list)
     adaptive_notes: List[str] = Field(default_factory=list)
 
 
-class InterviewBriefing(BaseModel):
+class FusedAnalysisPlan(_PipelineModel):
+    profile_analysis: ProfileAnalysis
+    interview_plan: InterviewPlan
+
+
+class InterviewBriefing(_PipelineModel):
     candidate_context: str
     conversation_guidelines: str | dict
     questions_script: List[dict]
@@ -116,10 +151,11 @@ class InterviewBriefing(BaseModel):
 
 class InterviewPrepState(TypedDict):
     resume_data: dict
+    resume_json: NotRequired[str]
     life_stage: str
     user_name: str
     tenant_config: Optional[dict]
-    profile_analysis: Optional[dict]
-    interview_plan: Optional[dict]
-    interview_briefing: Optional[dict]
+    profile_analysis: NotRequired[ProfileAnalysis | dict]
+    interview_plan: NotRequired[InterviewPlan | dict]
+    interview_briefing: NotRequired[InterviewBriefing | dict]
     errors: List[str]
@@ -1,47 +1,119 @@
 import asyncio
-import json
+import hashlib
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Optional
-
-from fastapi import FastAPI, HTTPException, UploadFile, File, Form
+from types import MappingProxyType
+from typing import Any, Optional
+
+import aiohttp
+import orjson
+from fastapi import (
+    BackgroundTasks,
+    Depends,
+    FastAPI,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+    File,
+    Form,
+)
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
 from livekit import api
 from livekit.api import LiveKitAPI
-from pydantic import BaseModel
-
-from core.config import livekit_url, livekit_api_key, livekit_api_secret
+from pydantic import BaseModel, ValidationError
+
+from core.config import (
+    LIVEKIT_SECRETS,
+    get_secret,
+    livekit_url,
+    livekit_api_key,
+    livekit_api_secret,
+)
 from core.extraction import (
     extract_profile_from_transcript,
     extract_profile_features,
     convert_to_profile_format,
 )
+from core.tokens import room_join_token
 from core.enhancement import enhance_resume, convert_resume_to_profile
-from interview_prep import run_interview_prep_pipeline
-from resume.parser import parse_resume, get_mime_type
+from interview_prep import run_interview_prep_pipeline, stream_interview_prep_pipeline
+from interview_prep.context_cache import delete_context_caches
+from resume.parser import EXTENSION_MIME_TYPES, parse_resume, get_mime_type
 from storage import get_storage
 from tenants.loader import load_tenant
 
+logger = logging.getLogger(__name__)
+
+# Create rooms after the token response is sent. Off by default: the agent reads the
+# briefing from room metadata on join, so the room must exist before the client connects.
+BACKGROUND_ROOM_CREATE = os.getenv("BACKGROUND_ROOM_CREATE", "0") == "1"
+LIVEKIT_MAX_CONNECTIONS = 100
+LIVEKIT_KEEPALIVE_SECONDS = 60
+
 _livekit_api: LiveKitAPI | None = None
+_livekit_session: aiohttp.ClientSession | None = None
 
 
 async def _get_livekit_api() -> LiveKitAPI:
-    global _livekit_api
+    global _livekit_api, _livekit_session
     if _livekit_api is None:
+        # Resolve credentials first so a missing secret doesn't leave an open session behind.
+        url = livekit_url().replace("wss://", "https://").replace("ws://", "http://")
+        api_key, api_secret = livekit_api_key(), livekit_api_secret()
+        # LiveKitAPI talks over aiohttp (HTTP/1.1); keep connections alive between
+        # token requests instead of re-doing the TLS handshake.
+        _livekit_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=LIVEKIT_MAX_CONNECTIONS,
+                keepalive_timeout=LIVEKIT_KEEPALIVE_SECONDS,
+            )
+        )
         _livekit_api = LiveKitAPI(
-            url=livekit_url().replace("wss://", "https://").replace("ws://", "http://"),
-            api_key=livekit_api_key(),
-            api_secret=livekit_api_secret(),
+            url=url, api_key=api_key, api_secret=api_secret, session=_livekit_session
         )
     return _livekit_api
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # The LiveKit secrets are independent reads; fetch them together so the first
+    # token request doesn't pay three sequential Secret Manager round trips.
+    await asyncio.gather(
+        *(asyncio.to_thread(get_secret, secret_id, env) for secret_id, env in LIVEKIT_SECRETS)
+    )
+    # Build the LiveKit client and open a connection before the first /api/token.
+    try:
+        lk_api = await _get_livekit_api()
+        await lk_api.room.list_rooms(api.ListRoomsRequest(names=["__warmup__"]))
+    except Exception as e:
+        logger.warning("LiveKit warm-up failed: %s", e)
+
+    yield
+
+    await delete_context_caches()
+    if _livekit_api is not None:
+        await _livekit_api.aclose()
+    if _livekit_session is not None:
+        await _livekit_session.close()
+
+
 app = FastAPI(
     title="MBIO Voice Agent API",
     description="Backend API for voice-based profile creation",
     version="2.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -51,6 +123,14 @@ app.add_middleware(
 )
 
 
+def _deep_freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        return MappingProxyType({k: _deep_freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_deep_freeze(v) for v in value)
+    return value
+
+
 VOICE_QUESTIONS = {
     "school": [
         {
@@ -129,13 +209,118 @@ VOICE_QUESTIONS = {
     ],
 }
 
+# Frozen so nothing can mutate the questions behind the pre-encoded responses below.
+VOICE_QUESTIONS = _deep_freeze(VOICE_QUESTIONS)
+
 PHASES_ORDER = ["school", "life", "skills", "impact"]
 
-ALLOWED_MIME_TYPES = [
-    "application/pdf",
-    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-    "application/msword",
-]
+
+def _filter_questions(questions: tuple, life_stage: str | None) -> tuple:
+    if not life_stage:
+        return questions
+    return tuple(
+        q
+        for q in questions
+        if not q.get("conditional") or life_stage in q["conditional"].get("values", ())
+    )
+
+
+def _etag(body: bytes) -> str:
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def _dump_questions(payload: dict) -> tuple[bytes, str]:
+    body = orjson.dumps(payload, default=dict)
+    return body, _etag(body)
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    return if_none_match.strip() == "*" or etag in (
+        tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+    )
+
+
+def _json_response(
+    body: bytes, etag: str, if_none_match: str | None, cache_control: str | None = None
+) -> Response:
+    headers = {"ETag": etag}
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+
+def _phase_payload(phase: str, questions: tuple) -> dict:
+    return {"questions": questions, "phase": phase, "total_questions": len(questions)}
+
+
+def _all_phases_payload(by_phase: dict[str, tuple]) -> dict:
+    return {
+        "phases": PHASES_ORDER,
+        "questions_by_phase": by_phase,
+        "total_questions": sum(map(len, by_phase.values())),
+    }
+
+
+# Question lists are static, so the per-life-stage filtering and the JSON encoding
+# of both voice-question responses are done once at import. Any life stage no
+# question is conditional on sees the same unconditional subset, keyed "*".
+_CONDITIONAL_LIFE_STAGES = frozenset(
+    stage
+    for questions in VOICE_QUESTIONS.values()
+    for q in questions
+    if q.get("conditional")
+    for stage in q["conditional"].get("values", ())
+)
+_OTHER_LIFE_STAGE = "*"
+
+
+def _life_stage_key(life_stage: str | None) -> str | None:
+    if not life_stage:
+        return None
+    return life_stage if life_stage in _CONDITIONAL_LIFE_STAGES else _OTHER_LIFE_STAGE
+
+
+_FILTERED_QUESTIONS = {
+    life_stage: {
+        phase: _filter_questions(VOICE_QUESTIONS[phase], life_stage)
+        for phase in PHASES_ORDER
+    }
+    for life_stage in (None, _OTHER_LIFE_STAGE, *sorted(_CONDITIONAL_LIFE_STAGES))
+}
+_PHASE_QUESTIONS_JSON = {
+    (phase, life_stage): _dump_questions(_phase_payload(phase, questions))
+    for life_stage, by_phase in _FILTERED_QUESTIONS.items()
+    for phase, questions in by_phase.items()
+}
+_ALL_QUESTIONS_JSON = {
+    life_stage: _dump_questions(_all_phases_payload(by_phase))
+    for life_stage, by_phase in _FILTERED_QUESTIONS.items()
+}
+
+_health_timestamp: dict = {"at": float("-inf"), "iso": ""}
+
+# Serialized /api/sessions bodies per `limit`, each rebuilt only when the storage
+# fingerprint changes. Bounded, oldest entry evicted first.
+SESSIONS_CACHE_LIMITS = 8
+_sessions_cache: dict[int | None, tuple[Any, bytes, str]] = {}
+# Per-session summaries keyed by session.json version, so a rebuild only re-reads
+# sessions that changed; the lock keeps concurrent misses from rebuilding twice.
+_session_summaries: dict[str, tuple[int, dict]] = {}
+_sessions_lock = asyncio.Lock()
+# Caps session-file reads in flight so a large listing doesn't take every
+# default-executor thread away from other handlers.
+SESSION_READ_CONCURRENCY = 16
+_session_reads = asyncio.Semaphore(SESSION_READ_CONCURRENCY)
+SESSIONS_CACHE_CONTROL = "private, max-age=30"
+
+MAX_UPLOAD_BYTES = 50 * 1024 * 1024
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+
+ALLOWED_MIME_TYPES = frozenset(EXTENSION_MIME_TYPES.values())
 
 
 class TokenRequest(BaseModel):
@@ -152,8 +337,10 @@ class TokenResponse(BaseModel):
     room_name: str
 
 
+# Transcripts are forwarded untouched to the extractors, so their entries are typed
+# Any to skip per-item validation on long interviews.
 class ExtractProfileRequest(BaseModel):
-    transcript: list[dict]
+    transcript: list[Any]
 
 
 class QuestionResponse(BaseModel):
@@ -164,13 +351,13 @@ class QuestionResponse(BaseModel):
 
 class GenerateProfileRequest(BaseModel):
     basics_answers: dict
-    transcript: list[dict]
+    transcript: list[Any]
     session_id: str | None = None
 
 
 class EnhanceResumeRequest(BaseModel):
     resume_data: dict
-    transcript: list[dict]
+    transcript: list[Any]
     profile_analysis: dict | None = None
     basics_answers: dict | None = None
 
@@ -183,6 +370,30 @@ class PrepareInterviewRequest(BaseModel):
     position_id: str | None = None
 
 
+def json_body(model: type[BaseModel]):
+    # Validate the raw body bytes in one pass instead of json.loads + dict validation.
+    async def parse(request: Request) -> BaseModel:
+        try:
+            return model.model_validate_json(await request.body())
+        except ValidationError as e:
+            # Prefix "body" like FastAPI's own body validation so clients see the same loc.
+            raise RequestValidationError(
+                [{**err, "loc": ("body", *err["loc"])} for err in e.errors(include_url=False)]
+            )
+
+    return parse
+
+
+def json_body_schema(model: type[BaseModel]) -> dict:
+    # json_body reads the raw request, so document the body for OpenAPI explicitly.
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model.model_json_schema()}},
+        }
+    }
+
+
 @app.get("/")
 async def root():
     return {"service": "MBIO Voice Agent API", "status": "running", "version": "2.0.0"}
@@ -190,7 +401,11 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "timestamp": datetime.now().isoformat()}
+    # Probes hit this constantly; second resolution is enough for the timestamp.
+    now = time.monotonic()
+    if now - _health_timestamp["at"] >= 1:
+        _health_timestamp.update(at=now, iso=datetime.now().isoformat())
+    return {"status": "healthy", "timestamp": _health_timestamp["iso"]}
 
 
 @app.get("/api/tenant/{tenant_id}")
@@ -210,57 +425,65 @@ async def get_tenant(tenant_id: str):
         raise HTTPException(status_code=404, detail=f"Tenant not found: {e}")
 
 
-@app.post("/api/token", response_model=TokenResponse)
-async def generate_token(request: TokenRequest):
+async def _create_room(request: TokenRequest) -> None:
     try:
-        identity = request.participant_identity or request.participant_name
-        token = (
-            api.AccessToken(livekit_api_key(), livekit_api_secret())
-            .with_identity(identity)
-            .with_name(request.participant_name)
-            .with_grants(
-                api.VideoGrants(
-                    room_join=True,
-                    room=request.room_name,
-                    can_publish=True,
-                    can_subscribe=True,
-                    can_publish_data=True,
-                )
+        lk_api = await _get_livekit_api()
+        room_metadata = {
+            "participant_name": request.participant_name,
+            "created_at": datetime.now().isoformat(),
+        }
+        has_briefing = request.interview_briefing is not None
+        has_plan = request.interview_plan is not None
+        if request.interview_briefing:
+            room_metadata["interview_briefing"] = request.interview_briefing
+        if request.interview_plan:
+            room_metadata["interview_plan"] = request.interview_plan
+        metadata_json = orjson.dumps(room_metadata).decode()
+        logger.debug(
+            "Creating room %s | briefing=%s | plan=%s | metadata_size=%d",
+            request.room_name, has_briefing, has_plan, len(metadata_json),
+        )
+        await lk_api.room.create_room(
+            api.CreateRoomRequest(
+                name=request.room_name,
+                metadata=metadata_json,
             )
         )
-        jwt_token = token.to_jwt()
+        logger.debug("Room %s created", request.room_name)
+    except Exception as e:
+        logger.warning("Room %s creation failed: %s", request.room_name, e)
 
-        try:
-            lk_api = await _get_livekit_api()
-            room_metadata = {
-                "participant_name": request.participant_name,
-                "created_at": datetime.now().isoformat(),
-            }
-            has_briefing = request.interview_briefing is not None
-            has_plan = request.interview_plan is not None
-            if request.interview_briefing:
-                room_metadata["interview_briefing"] = request.interview_briefing
-            if request.interview_plan:
-                room_metadata["interview_plan"] = request.interview_plan
-            metadata_json = json.dumps(room_metadata)
-            print(f"[TOKEN] Creating room {request.room_name} | briefing={has_briefing} | plan={has_plan} | metadata_size={len(metadata_json)}")
-            await lk_api.room.create_room(
-                api.CreateRoomRequest(
-                    name=request.room_name,
-                    metadata=metadata_json,
-                )
-            )
-            print(f"[TOKEN] Room created successfully")
-        except Exception as e:
-            print(f"[TOKEN] Room creation FAILED: {e}")
 
-        return TokenResponse(token=jwt_token, url=livekit_url(), room_name=request.room_name)
+async def _sign_token(request: TokenRequest) -> str:
+    return room_join_token(
+        identity=request.participant_identity or request.participant_name,
+        name=request.participant_name,
+        room=request.room_name,
+    )
+
+
+@app.post("/api/token", responses={200: {"model": TokenResponse}})
+async def generate_token(request: TokenRequest, background_tasks: BackgroundTasks):
+    try:
+        if BACKGROUND_ROOM_CREATE:
+            background_tasks.add_task(_create_room, request)
+            jwt_token = await _sign_token(request)
+        else:
+            # gather starts the room task first, so its request is already in flight
+            # while the token is signed.
+            _, jwt_token = await asyncio.gather(_create_room(request), _sign_token(request))
+
+        return {"token": jwt_token, "url": livekit_url(), "room_name": request.room_name}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to generate token: {e}")
 
 
-@app.get("/api/voice-questions", response_model=QuestionResponse)
-async def get_voice_questions(phase: str, life_stage: Optional[str] = None):
+@app.get("/api/voice-questions", responses={200: {"model": QuestionResponse}})
+async def get_voice_questions(
+    phase: str,
+    life_stage: Optional[str] = None,
+    if_none_match: str | None = Header(None),
+):
     phase_lower = phase.lower()
     if phase_lower not in VOICE_QUESTIONS:
         raise HTTPException(
@@ -268,36 +491,36 @@ async def get_voice_questions(phase: str, life_stage: Optional[str] = None):
             detail=f"Invalid phase. Valid phases: {list(VOICE_QUESTIONS.keys())}",
         )
 
-    questions = _filter_questions(VOICE_QUESTIONS[phase_lower], life_stage)
-    return QuestionResponse(questions=questions, phase=phase_lower, total_questions=len(questions))
+    body, etag = _PHASE_QUESTIONS_JSON[phase_lower, _life_stage_key(life_stage)]
+    return _json_response(body, etag, if_none_match)
 
 
 @app.get("/api/voice-questions/all")
-async def get_all_voice_questions(life_stage: Optional[str] = None):
-    result = {
-        phase: _filter_questions(VOICE_QUESTIONS[phase], life_stage)
-        for phase in PHASES_ORDER
-    }
-    return {
-        "phases": PHASES_ORDER,
-        "questions_by_phase": result,
-        "total_questions": sum(len(q) for q in result.values()),
-    }
+async def get_all_voice_questions(
+    life_stage: Optional[str] = None,
+    if_none_match: str | None = Header(None),
+):
+    body, etag = _ALL_QUESTIONS_JSON[_life_stage_key(life_stage)]
+    return _json_response(body, etag, if_none_match)
 
 
-@app.post("/api/extract-profile")
-async def extract_profile(request: ExtractProfileRequest):
+@app.post("/api/extract-profile", openapi_extra=json_body_schema(ExtractProfileRequest))
+async def extract_profile(
+    request: ExtractProfileRequest = Depends(json_body(ExtractProfileRequest)),
+):
     try:
-        profile = extract_profile_from_transcript(request.transcript)
+        profile = await extract_profile_from_transcript(request.transcript)
         return {"success": True, "profile": profile}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Profile extraction failed: {e}")
 
 
-@app.post("/api/generate-profile")
-async def generate_profile_from_interview(request: GenerateProfileRequest):
+@app.post("/api/generate-profile", openapi_extra=json_body_schema(GenerateProfileRequest))
+async def generate_profile_from_interview(
+    request: GenerateProfileRequest = Depends(json_body(GenerateProfileRequest)),
+):
     try:
-        extracted = extract_profile_features(
+        extracted = await extract_profile_features(
             transcript=request.transcript,
             basics_answers=request.basics_answers,
         )
@@ -307,8 +530,10 @@ async def generate_profile_from_interview(request: GenerateProfileRequest):
         raise HTTPException(status_code=500, detail=f"Profile generation failed: {e}")
 
 
-@app.post("/api/enhance-resume")
-async def enhance_resume_endpoint(request: EnhanceResumeRequest):
+@app.post("/api/enhance-resume", openapi_extra=json_body_schema(EnhanceResumeRequest))
+async def enhance_resume_endpoint(
+    request: EnhanceResumeRequest = Depends(json_body(EnhanceResumeRequest)),
+):
     try:
         original_profile = convert_resume_to_profile(request.resume_data)
         enhanced_profile = enhance_resume(
@@ -323,59 +548,117 @@ async def enhance_resume_endpoint(request: EnhanceResumeRequest):
             "enhanced": enhanced_profile,
         }
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception("Resume enhancement failed")
         raise HTTPException(status_code=500, detail=f"Resume enhancement failed: {e}")
 
 
+def _cached_session_summary(storage, session_id: str) -> dict | None:
+    version = storage.artifact_version(session_id, "session")
+    cached = _session_summaries.get(session_id)
+    if version is not None and cached is not None and cached[0] == version:
+        return cached[1]
+    summary = storage.load_session_summary(session_id)
+    if version is not None and summary:
+        _session_summaries[session_id] = (version, summary)
+    return summary
+
+
+async def _read_session_summary(storage, session_id: str) -> dict | None:
+    async with _session_reads:
+        return await asyncio.to_thread(_cached_session_summary, storage, session_id)
+
+
+async def _rebuild_sessions(storage, fingerprint, limit: int | None) -> tuple[bytes, str]:
+    # Sessions are independent files, so read them concurrently.
+    session_ids = await asyncio.to_thread(storage.list_sessions, limit)
+    summaries = await asyncio.gather(
+        *(_read_session_summary(storage, sid) for sid in session_ids),
+        return_exceptions=True,
+    )
+    sessions = [s for s in summaries if s and not isinstance(s, BaseException)]
+    if limit is None:
+        for sid in _session_summaries.keys() - set(session_ids):
+            del _session_summaries[sid]
+
+    body = orjson.dumps({"sessions": sessions})
+    etag = _etag(body)
+    if fingerprint is not None:
+        _sessions_cache.pop(limit, None)
+        while len(_sessions_cache) >= SESSIONS_CACHE_LIMITS:
+            del _sessions_cache[next(iter(_sessions_cache))]
+        _sessions_cache[limit] = (fingerprint, body, etag)
+    return body, etag
+
+
+# Storage calls are blocking filesystem I/O; keep them off the event loop.
 @app.get("/api/sessions")
-async def list_sessions():
+async def list_sessions(
+    limit: int | None = Query(None, ge=1),
+    if_none_match: str | None = Header(None),
+):
     storage = get_storage()
-    session_ids = storage.list_sessions()
-    sessions = []
-
-    for sid in session_ids:
-        data = storage.load_json(sid, "session")
-        if data:
-            sessions.append(
-                {
-                    "session_id": data.get("session_id", sid),
-                    "room_name": data.get("room_name"),
-                    "timestamp": data.get("timestamp"),
-                    "duration": data.get("duration", {}).get("formatted"),
-                    "has_audio": data.get("audio_file") is not None,
-                    "transcript_count": len(data.get("transcript", [])),
-                }
-            )
-
-    return {"sessions": sessions}
+    fingerprint = await asyncio.to_thread(storage.sessions_fingerprint)
+    cached = _sessions_cache.get(limit)
+    if fingerprint is None or cached is None or cached[0] != fingerprint:
+        async with _sessions_lock:
+            cached = _sessions_cache.get(limit)
+            if fingerprint is None or cached is None or cached[0] != fingerprint:
+                cached = (fingerprint, *await _rebuild_sessions(storage, fingerprint, limit))
+    _, body, etag = cached
+    return _json_response(body, etag, if_none_match, SESSIONS_CACHE_CONTROL)
 
 
 @app.get("/api/sessions/{session_id}")
-async def get_session(session_id: str):
+async def get_session(session_id: str, if_none_match: str | None = Header(None)):
     storage = get_storage()
-    data = storage.load_json(session_id, "session")
+    version, audio_path = await asyncio.gather(
+        asyncio.to_thread(storage.artifact_version, session_id, "session"),
+        asyncio.to_thread(storage.get_artifact_path, session_id, "audio"),
+    )
+    # The payload only depends on session.json and whether the audio exists, so a
+    # matching validator can be answered without reading the session.
+    etag = None if version is None else f'"{version}-{int(audio_path is not None)}"'
+    if etag is not None and _etag_matches(if_none_match, etag):
+        return Response(
+            status_code=304, headers={"ETag": etag, "Cache-Control": SESSIONS_CACHE_CONTROL}
+        )
 
+    data = await asyncio.to_thread(storage.load_json, session_id, "session")
     if not data:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    data["audio_available"] = storage.get_artifact_path(session_id, "audio") is not None
-    return data
+    data["audio_available"] = audio_path is not None
+    if etag is None:
+        return data
+    return _json_response(orjson.dumps(data), etag, None, SESSIONS_CACHE_CONTROL)
 
 
 @app.get("/api/sessions/{session_id}/audio")
 async def get_session_audio(session_id: str):
     storage = get_storage()
-    audio_path = storage.get_artifact_path(session_id, "audio")
+    audio_path = await asyncio.to_thread(storage.get_artifact_path, session_id, "audio")
 
     if not audio_path:
         raise HTTPException(status_code=404, detail="Audio file not found")
 
-    return FileResponse(audio_path, media_type="audio/ogg", filename=f"{session_id}.ogg")
+    # Recordings are written once per session; the stat gives Starlette what it needs
+    # for Content-Length, ETag/Last-Modified and conditional requests.
+    stat_result = await asyncio.to_thread(os.stat, audio_path)
+    return FileResponse(
+        audio_path,
+        media_type="audio/ogg",
+        filename=f"{session_id}.ogg",
+        stat_result=stat_result,
+        headers={"Cache-Control": "private, max-age=31536000, immutable"},
+    )
 
 
-@app.post("/api/prepare-interview")
-async def prepare_interview(request: PrepareInterviewRequest):
+@app.post(
+    "/api/prepare-interview", openapi_extra=json_body_schema(PrepareInterviewRequest)
+)
+async def prepare_interview(
+    request: PrepareInterviewRequest = Depends(json_body(PrepareInterviewRequest)),
+):
     try:
         result = await run_interview_prep_pipeline(
             resume_data=request.resume_data,
@@ -395,30 +678,42 @@ async def prepare_interview(request: PrepareInterviewRequest):
         raise HTTPException(status_code=500, detail=f"Failed to prepare interview: {e}")
 
 
+@app.post(
+    "/api/prepare-interview/stream", openapi_extra=json_body_schema(PrepareInterviewRequest)
+)
+async def prepare_interview_stream(
+    request: PrepareInterviewRequest = Depends(json_body(PrepareInterviewRequest)),
+):
+    # One NDJSON event per pipeline stage as soon as it completes, then a final "done" event.
+    # The 200 status is already sent, so a failure is reported as an "error" event instead.
+    async def events():
+        try:
+            async for event in stream_interview_prep_pipeline(
+                resume_data=request.resume_data,
+                life_stage=request.life_stage,
+                user_name=request.user_name,
+                tenant_id=request.tenant_id,
+                position_id=request.position_id,
+            ):
+                yield orjson.dumps(event) + b"\n"
+        except Exception as e:
+            logger.exception("Interview prep stream failed")
+            detail = f"Failed to prepare interview: {e}"
+            yield orjson.dumps({"stage": "error", "detail": detail}) + b"\n"
+            yield orjson.dumps({"stage": "done", "errors": [detail], "trace_id": None}) + b"\n"
+
+    return StreamingResponse(events(), media_type="application/x-ndjson")
+
+
 @app.post("/api/process-resume")
 async def process_resume(
     file: UploadFile = File(...),
     linkedin_url: Optional[str] = Form(None),
 ):
-    mime_type = file.content_type
-    if mime_type not in ALLOWED_MIME_TYPES:
-        try:
-            mime_type = get_mime_type(file.filename)
-        except ValueError as e:
-            raise HTTPException(status_code=400, detail=str(e))
-
-    file_bytes = await file.read()
-
-    if len(file_bytes) == 0:
-        raise HTTPException(status_code=400, detail="Empty file uploaded")
-    if len(file_bytes) > 50 * 1024 * 1024:
-        raise HTTPException(status_code=400, detail="File too large. Maximum size is 50MB")
+    file_bytes, mime_type = await _read_resume_upload(file)
 
     try:
-        extracted_data = await asyncio.to_thread(
-            parse_resume, file_bytes=file_bytes, mime_type=mime_type, filename=file.filename
-        )
-        _inject_linkedin(extracted_data, linkedin_url)
+        extracted_data = await _parse_resume_upload(file, file_bytes, mime_type, linkedin_url)
         return {
             "success": True,
             "data": extracted_data,
@@ -437,25 +732,10 @@ async def process_resume_and_prepare_interview(
     position_id: str = Form(...),
     linkedin_url: str | None = Form(None),
 ):
-    mime_type = file.content_type
-    if mime_type not in ALLOWED_MIME_TYPES:
-        try:
-            mime_type = get_mime_type(file.filename)
-        except ValueError as e:
-            raise HTTPException(status_code=400, detail=str(e))
-
-    file_bytes = await file.read()
-
-    if len(file_bytes) == 0:
-        raise HTTPException(status_code=400, detail="Empty file uploaded")
-    if len(file_bytes) > 50 * 1024 * 1024:
-        raise HTTPException(status_code=400, detail="File too large. Maximum size is 50MB")
+    file_bytes, mime_type = await _read_resume_upload(file)
 
     try:
-        extracted_data = await asyncio.to_thread(
-            parse_resume, file_bytes=file_bytes, mime_type=mime_type, filename=file.filename
-        )
-        _inject_linkedin(extracted_data, linkedin_url)
+        extracted_data = await _parse_resume_upload(file, file_bytes, mime_type, linkedin_url)
 
         user_name = extracted_data.get("basics", {}).get("name", "Candidate")
 
@@ -483,14 +763,43 @@ async def process_resume_and_prepare_interview(
         )
 
 
-def _filter_questions(questions: list[dict], life_stage: str | None) -> list[dict]:
-    if not life_stage:
-        return questions
-    return [
-        q
-        for q in questions
-        if not q.get("conditional") or life_stage in q["conditional"].get("values", [])
-    ]
+async def _read_resume_upload(file: UploadFile) -> tuple[bytes, str]:
+    mime_type = file.content_type
+    if mime_type not in ALLOWED_MIME_TYPES:
+        try:
+            mime_type = get_mime_type(file.filename)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    return await _read_upload(file), mime_type
+
+
+async def _parse_resume_upload(
+    file: UploadFile, file_bytes: bytes, mime_type: str, linkedin_url: str | None
+) -> dict:
+    extracted_data = await asyncio.to_thread(
+        parse_resume, file_bytes=file_bytes, mime_type=mime_type, filename=file.filename
+    )
+    _inject_linkedin(extracted_data, linkedin_url)
+    return extracted_data
+
+
+async def _read_upload(file: UploadFile) -> bytes:
+    # Reject by the declared size when known, and stop reading once past the limit
+    # instead of materializing the whole upload first.
+    too_large = HTTPException(status_code=400, detail="File too large. Maximum size is 50MB")
+    if file.size is not None and file.size > MAX_UPLOAD_BYTES:
+        raise too_large
+
+    buffer = bytearray()
+    while chunk := await file.read(UPLOAD_CHUNK_BYTES):
+        buffer.extend(chunk)
+        if len(buffer) > MAX_UPLOAD_BYTES:
+            raise too_large
+
+    if not buffer:
+        raise HTTPException(status_code=400, detail="Empty file uploaded")
+    return bytes(buffer)
 
 
 def _inject_linkedin(extracted_data: dict, linkedin_url: str | None) -> None:
@@ -500,11 +809,8 @@ def _inject_linkedin(extracted_data: dict, linkedin_url: str | None) -> None:
     extracted_data.setdefault("basics", {})
     extracted_data["basics"].setdefault("profiles", [])
 
-    linkedin_exists = any(
-        p.get("network", "").lower() == "linkedin"
-        for p in extracted_data["basics"]["profiles"]
-    )
-    if not linkedin_exists:
+    networks = {p.get("network", "").lower() for p in extracted_data["basics"]["profiles"]}
+    if "linkedin" not in networks:
         extracted_data["basics"]["profiles"].append(
             {"network": "LinkedIn", "url": linkedin_url.strip()}
         )
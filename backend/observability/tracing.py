@@ -1,23 +1,50 @@
+import hashlib
+import inspect
+import os
+import time
 from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
 from functools import wraps
 from typing import Any
 
 from core.clients import get_langfuse_client
+from core.config import GEMINI_MODEL
+
+TRACE_TEXT_LIMIT = 2000
+TRACING_ENABLED = os.getenv("LANGFUSE_TRACING_ENABLED", "true").lower() not in ("false", "0")
+# The Langfuse SDK exports from a background worker and flushes on interpreter
+# shutdown; a blocking flush per trace is only useful for short-lived scripts.
+ENFORCE_FLUSH = os.getenv("LANGFUSE_ENFORCE_FLUSH", "0") == "1"
 
 
 class _NullGeneration:
+    __slots__ = ()
+
     def update(self, **kwargs):
         pass
 
 
+_NULL_GENERATION = _NullGeneration()
+
+
 @contextmanager
-def traced_generation(name: str, *, model: str, prompt=None, input_data=None):
-    langfuse = get_langfuse_client()
+def traced_generation(
+    name: str, *, model: str, prompt=None, input_data=None, input_limits=None
+):
+    langfuse = get_langfuse_client() if TRACING_ENABLED else None
     if not langfuse:
-        yield _NullGeneration()
+        yield _NULL_GENERATION
         return
 
+    # Prompts are truncated here rather than by callers so untraced requests skip the work.
+    if input_data is not None:
+        limits = {"user": TRACE_TEXT_LIMIT} if input_limits is None else input_limits
+        input_data = {
+            key: truncate_for_trace(value, limits[key]) if key in limits else value
+            for key, value in input_data.items()
+        }
+
     try:
         ctx = langfuse.start_as_current_observation(
             as_type="generation",
@@ -28,7 +55,7 @@ def traced_generation(name: str, *, model: str, prompt=None, input_data=None):
         )
         gen = ctx.__enter__()
     except Exception:
-        yield _NullGeneration()
+        yield _NULL_GENERATION
         return
 
     try:
@@ -52,15 +79,19 @@ class PipelineTrace:
         self.pipeline_name = pipeline_name
         self.user_name = user_name
         self.life_stage = life_stage
-        self.session_id = session_id or datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.session_id = session_id if session_id is not None else time.strftime("%Y%m%d_%H%M%S")
         self.metadata = metadata or {}
-        self.start_time: datetime | None = None
+        self._start_ns: int | None = None
         self.langfuse = get_langfuse_client()
         self._span = None
         self.nodes_logged: list[dict] = []
+        self._pending: list[dict] = []
+        self._serialized: dict[int, tuple[Any, Any]] = {}
+        self._context_token = None
 
     def __enter__(self):
-        self.start_time = datetime.now()
+        self._start_ns = time.perf_counter_ns()
+        self._context_token = current_trace.set(self)
 
         if self.langfuse:
             try:
@@ -71,7 +102,7 @@ class PipelineTrace:
                     session_id=self.session_id,
                     metadata={
                         "life_stage": self.life_stage,
-                        "started_at": self.start_time.isoformat(),
+                        "started_at": datetime.now().isoformat(),
                         **self.metadata,
                     },
                 )
@@ -82,60 +113,120 @@ class PipelineTrace:
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         if self._span:
+            self._submit_pending()
             try:
                 self.langfuse.update_current_span(
                     output={
                         "status": "ERROR" if exc_type else "OK",
                         "nodes_completed": len(self.nodes_logged),
                         "nodes": self.nodes_logged,
+                        "duration_ms": round((time.perf_counter_ns() - self._start_ns) / 1e6, 1),
                     },
                 )
                 self._span.__exit__(exc_type, exc_val, exc_tb)
             except Exception:
                 pass
+        self._pending.clear()
+        self._serialized.clear()
+        current_trace.reset(self._context_token)
 
-        if self.langfuse:
+        if self.langfuse and ENFORCE_FLUSH:
             try:
                 self.langfuse.flush()
             except Exception:
                 pass
 
+    def _serialize(self, data: Any) -> Any:
+        # A node's output model is usually the next node's input; dump it once per trace.
+        # The object is kept alongside its dump so its id() cannot be reused meanwhile.
+        if not hasattr(data, "model_dump"):
+            return _safe_serialize(data)
+        cached = self._serialized.get(id(data))
+        if cached is None:
+            cached = (data, _safe_serialize(data))
+            self._serialized[id(data)] = cached
+        return cached[1]
+
     def log_node(
         self,
         node_name: str,
         input_data: Any,
         output_data: Any,
         duration_ms: float,
-        model: str = "gemini-2.0-flash",
+        model: str = GEMINI_MODEL,
         error: str | None = None,
     ):
         self.nodes_logged.append(
             {"node": node_name, "duration_ms": round(duration_ms, 1), "success": error is None}
         )
 
-        if not self.langfuse:
-            return
+        if self.langfuse:
+            self._pending.append(
+                {
+                    "name": node_name,
+                    "model": model,
+                    "input": input_data,
+                    "output": output_data,
+                    "duration_ms": round(duration_ms, 1),
+                }
+            )
+
+    def _submit_pending(self):
+        # Node events are buffered while the pipeline runs and sent together under the span.
+        for event in self._pending:
+            try:
+                with self.langfuse.start_as_current_observation(
+                    as_type="generation",
+                    name=event["name"],
+                    model=event["model"],
+                    input=self._serialize(event["input"]),
+                ):
+                    self.langfuse.update_current_generation(
+                        output=self._serialize(event["output"]),
+                        metadata={"duration_ms": event["duration_ms"]},
+                    )
+            except Exception:
+                pass
 
-        try:
-            with self.langfuse.start_as_current_observation(
-                as_type="generation",
-                name=node_name,
-                model=model,
-                input=_safe_serialize(input_data),
-            ):
-                self.langfuse.update_current_generation(
-                    output=_safe_serialize(output_data),
-                    metadata={"duration_ms": round(duration_ms, 1)},
-                )
-        except Exception:
-            pass
+
+current_trace: ContextVar[PipelineTrace | None] = ContextVar("current_trace", default=None)
+
+
+def _log_traced_node(node_name: str, state: Any, result: Any, start_ns: int, error: str | None):
+    trace = current_trace.get()
+    if trace is not None:
+        trace.log_node(
+            node_name=node_name,
+            input_data=_extract_input_summary(state),
+            output_data=_extract_output_summary(result),
+            duration_ms=(time.perf_counter_ns() - start_ns) / 1e6,
+            error=error,
+        )
 
 
 def traced_node(node_name: str):
     def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(state, *args, **kwargs):
+                start_ns = time.perf_counter_ns()
+                error = None
+                result = None
+
+                try:
+                    result = await func(state, *args, **kwargs)
+                    return result
+                except Exception as e:
+                    error = str(e)
+                    raise
+                finally:
+                    _log_traced_node(node_name, state, result, start_ns, error)
+
+            return async_wrapper
+
         @wraps(func)
         def wrapper(state, *args, **kwargs):
-            start_time = datetime.now()
+            start_ns = time.perf_counter_ns()
             error = None
             result = None
 
@@ -146,81 +237,90 @@ def traced_node(node_name: str):
                 error = str(e)
                 raise
             finally:
-                duration_ms = (datetime.now() - start_time).total_seconds() * 1000
-                trace = state.get("_trace") if isinstance(state, dict) else None
-                if trace and isinstance(trace, PipelineTrace):
-                    trace.log_node(
-                        node_name=node_name,
-                        input_data=_extract_input_summary(state),
-                        output_data=_extract_output_summary(result),
-                        duration_ms=duration_ms,
-                        error=error,
-                    )
+                _log_traced_node(node_name, state, result, start_ns, error)
 
         return wrapper
     return decorator
 
 
+def usage_details(usage: Any) -> dict | None:
+    if usage is None:
+        return None
+    try:
+        return {"input": usage.prompt_token_count, "output": usage.candidates_token_count}
+    except AttributeError:
+        return None
+
+
+def truncate_for_trace(text: str, limit: int = TRACE_TEXT_LIMIT) -> str:
+    if len(text) <= limit:
+        return text
+    digest = hashlib.blake2b(text.encode(), digest_size=8).hexdigest()
+    return f"{text[:limit]}... [truncated: {len(text)} chars, blake2b={digest}]"
+
+
 def _safe_serialize(data: Any) -> Any:
     if data is None:
         return None
     try:
         if hasattr(data, "model_dump"):
-            return data.model_dump()
+            return data.model_dump(mode="json", exclude_none=True)
         if hasattr(data, "dict"):
             return data.dict()
         if isinstance(data, (dict, list, str, int, float, bool)):
             return data
-        return str(data)[:500]
+        return truncate_for_trace(str(data), 500)
     except Exception:
-        return str(data)[:500]
+        return truncate_for_trace(str(data), 500)
 
 
 def _extract_input_summary(state: dict) -> dict:
     if not isinstance(state, dict):
         return {"type": str(type(state))}
+    get = state.get
     return {
-        "user_name": state.get("user_name"),
-        "life_stage": state.get("life_stage"),
-        "has_resume": bool(state.get("resume_data")),
-        "has_profile_analysis": bool(state.get("profile_analysis")),
-        "has_interview_plan": bool(state.get("interview_plan")),
+        "user_name": get("user_name"),
+        "life_stage": get("life_stage"),
+        "has_resume": bool(get("resume_data")),
+        "has_profile_analysis": get("profile_analysis") is not None,
+        "has_interview_plan": get("interview_plan") is not None,
     }
 
 
+def _field(obj: Any, name: str) -> Any:
+    if isinstance(obj, dict):
+        return obj.get(name, ())
+    return getattr(obj, name, ())
+
+
 def _extract_output_summary(result: Any) -> dict:
-    if result is None:
-        return {"type": "None"}
     if not isinstance(result, dict):
-        return {"type": str(type(result))}
+        return {"type": "None" if result is None else str(type(result))}
 
     summary = {}
 
-    if "profile_analysis" in result:
-        pa = result["profile_analysis"]
-        if isinstance(pa, dict):
-            summary["profile_analysis"] = {
-                "strengths_count": len(pa.get("strengths", [])),
-                "gaps_count": len(pa.get("gaps", [])),
-                "hooks_count": len(pa.get("interesting_hooks", [])),
-            }
-
-    if "interview_plan" in result:
-        ip = result["interview_plan"]
-        if isinstance(ip, dict):
-            phases = ip.get("phases", [])
-            summary["interview_plan"] = {
-                "phases_count": len(phases),
-                "questions_count": sum(len(p.get("questions", [])) for p in phases),
-            }
-
-    if "interview_briefing" in result:
-        ib = result["interview_briefing"]
-        if isinstance(ib, dict):
-            summary["interview_briefing"] = {
-                "questions_count": len(ib.get("questions_script", [])),
-                "hints_count": len(ib.get("personalization_hints", [])),
-            }
+    pa = result.get("profile_analysis")
+    if pa is not None:
+        summary["profile_analysis"] = {
+            "strengths_count": len(_field(pa, "strengths")),
+            "gaps_count": len(_field(pa, "gaps")),
+            "hooks_count": len(_field(pa, "interesting_hooks")),
+        }
+
+    ip = result.get("interview_plan")
+    if ip is not None:
+        phases = _field(ip, "phases")
+        summary["interview_plan"] = {
+            "phases_count": len(phases),
+            "questions_count": sum(len(_field(p, "questions")) for p in phases),
+        }
+
+    ib = result.get("interview_briefing")
+    if ib is not None:
+        summary["interview_briefing"] = {
+            "questions_count": len(_field(ib, "questions_script")),
+            "hints_count": len(_field(ib, "personalization_hints")),
+        }
 
     if "errors" in result:
         summary["errors"] = result["errors"]
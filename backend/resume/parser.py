@@ -1,11 +1,19 @@
-import json
+import os
 from datetime import datetime
 
+import orjson
 from google.genai import types
 
 from core.clients import get_gemini_client
+from core.config import GEMINI_MODEL
 
 
+EXTENSION_MIME_TYPES = {
+    ".pdf": "application/pdf",
+    ".docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    ".doc": "application/msword",
+}
+
 RESUME_SCHEMA = {
     "type": "object",
     "properties": {
@@ -167,7 +175,7 @@ def parse_resume(file_bytes: bytes, mime_type: str, filename: str = "resume") ->
     client = get_gemini_client()
 
     response = client.models.generate_content(
-        model="gemini-2.0-flash",
+        model=GEMINI_MODEL,
         contents=[
             types.Part.from_bytes(data=file_bytes, mime_type=mime_type),
             EXTRACTION_PROMPT,
@@ -178,7 +186,7 @@ def parse_resume(file_bytes: bytes, mime_type: str, filename: str = "resume") ->
         ),
     )
 
-    extracted_data = json.loads(response.text)
+    extracted_data = orjson.loads(response.text)
     gaps = generate_gaps_to_explore(extracted_data)
 
     return {
@@ -189,7 +197,7 @@ def parse_resume(file_bytes: bytes, mime_type: str, filename: str = "resume") ->
             "source_filename": filename,
             "source_mime_type": mime_type,
             "parsed_at": datetime.now().isoformat(),
-            "model": "gemini-2.0-flash",
+            "model": GEMINI_MODEL,
         },
     }
 
@@ -225,13 +233,9 @@ def generate_gaps_to_explore(extracted_data: dict) -> list[str]:
 
 
 def get_mime_type(filename: str) -> str:
-    lower_name = filename.lower()
-    if lower_name.endswith(".pdf"):
-        return "application/pdf"
-    if lower_name.endswith(".docx"):
-        return "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-    if lower_name.endswith(".doc"):
-        return "application/msword"
+    mime_type = EXTENSION_MIME_TYPES.get(os.path.splitext(filename or "")[1].lower())
+    if mime_type is not None:
+        return mime_type
     raise ValueError(
         f"Unsupported file type: {filename}. Please upload a PDF or Word document."
     )
@@ -214,15 +214,7 @@ PROMPTS: list[dict] = [
         "name": "pipeline/profile-analyzer-user",
         "type": "text",
         "prompt": (
-            "Analyze this resume and provide insights for personalizing their voice interview.\n"
-            "\n"
-            "Candidate Name: {{user_name}}\n"
-            "Declared Life Stage: {{life_stage}}\n"
-            "\n"
-            "Resume Data:\n"
-            "```json\n"
-            "{{resume_json}}\n"
-            "```\n"
+            "Analyze the resume below and provide insights for personalizing the candidate's voice interview.\n"
             "\n"
             "Provide your analysis as a JSON object with these fields:\n"
             "- life_stage: \"student\" or \"professional\" (confirm or correct based on resume)\n"
@@ -233,7 +225,16 @@ PROMPTS: list[dict] = [
             "- interesting_hooks: Array of {topic, reason, suggested_angle}\n"
             "- soft_skills_inference: Array of {skill, evidence, confidence}\n"
             "- key_experiences: Array of notable experiences to reference\n"
-            "- avoid_topics: Topics well-covered in resume (don't need to ask about)"
+            "- avoid_topics: Topics well-covered in resume (don't need to ask about)\n"
+            "\n"
+            "=== Candidate ===\n"
+            "Candidate Name: {{user_name}}\n"
+            "Declared Life Stage: {{life_stage}}\n"
+            "\n"
+            "Resume Data:\n"
+            "```json\n"
+            "{{resume_json}}\n"
+            "```"
         ),
         "labels": ["production"],
     },
@@ -277,15 +278,7 @@ PROMPTS: list[dict] = [
         "name": "pipeline/question-planner-user",
         "type": "text",
         "prompt": (
-            "Create a personalized interview plan for this candidate.\n"
-            "\n"
-            "Profile Analysis:\n"
-            "```json\n"
-            "{{profile_analysis_json}}\n"
-            "```\n"
-            "\n"
-            "Candidate Name: {{user_name}}\n"
-            "Life Stage: {{life_stage}}\n"
+            "Create a personalized interview plan for the candidate below.\n"
             "\n"
             "Create an interview plan as a JSON object with:\n"
             "- total_estimated_duration: string (e.g., \"8-10 min\")\n"
@@ -293,7 +286,16 @@ PROMPTS: list[dict] = [
             "  - Each question: {id, question, intent, priority, follow_up_if?, follow_up_question?, context_from_resume?}\n"
             "- adaptive_notes: Array of tips for adapting during the interview\n"
             "\n"
-            "Generate 6-10 questions total, distributed across the phases. Make them specific to THIS candidate."
+            "Generate 6-10 questions total, distributed across the phases. Make them specific to THIS candidate.\n"
+            "\n"
+            "=== Candidate ===\n"
+            "Candidate Name: {{user_name}}\n"
+            "Life Stage: {{life_stage}}\n"
+            "\n"
+            "Profile Analysis:\n"
+            "```json\n"
+            "{{profile_analysis_json}}\n"
+            "```"
         ),
         "labels": ["production"],
     },
@@ -335,6 +337,16 @@ PROMPTS: list[dict] = [
         "prompt": (
             "Create a complete interview briefing for the voice agent.\n"
             "\n"
+            "Create an interview briefing as a JSON object with:\n"
+            "- candidate_context: A paragraph the agent can use to understand who they're talking to\n"
+            "- conversation_guidelines: How the agent should conduct the conversation\n"
+            "- questions_script: Array of {question, notes, transition_to_next?}\n"
+            "- topics_to_avoid: Array of topics to skip\n"
+            "- personalization_hints: Array of specific ways to personalize (e.g., \"mention their project X\")\n"
+            "\n"
+            "Make this briefing feel like you're preparing a thoughtful human interviewer for this specific candidate.\n"
+            "\n"
+            "=== Candidate ===\n"
             "Candidate Name: {{user_name}}\n"
             "Life Stage: {{life_stage}}\n"
             "\n"
@@ -346,16 +358,7 @@ PROMPTS: list[dict] = [
             "Interview Plan:\n"
             "```json\n"
             "{{interview_plan_json}}\n"
-            "```\n"
-            "\n"
-            "Create an interview briefing as a JSON object with:\n"
-            "- candidate_context: A paragraph the agent can use to understand who they're talking to\n"
-            "- conversation_guidelines: How the agent should conduct the conversation\n"
-            "- questions_script: Array of {question, notes, transition_to_next?}\n"
-            "- topics_to_avoid: Array of topics to skip\n"
-            "- personalization_hints: Array of specific ways to personalize (e.g., \"mention their project X\")\n"
-            "\n"
-            "Make this briefing feel like you're preparing a thoughtful human interviewer for this specific candidate."
+            "```"
         ),
         "labels": ["production"],
     },
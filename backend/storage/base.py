@@ -1,6 +1,17 @@
 from abc import ABC, abstractmethod
 
 
+def summarize_session(session_id: str, data: dict) -> dict:
+    return {
+        "session_id": data.get("session_id", session_id),
+        "room_name": data.get("room_name"),
+        "timestamp": data.get("timestamp"),
+        "duration": data.get("duration", {}).get("formatted"),
+        "has_audio": data.get("audio_file") is not None,
+        "transcript_count": len(data.get("transcript", [])),
+    }
+
+
 class StorageDriver(ABC):
     @abstractmethod
     def save_artifact(
@@ -17,7 +28,19 @@ class StorageDriver(ABC):
     def load_artifact(self, session_id: str, artifact_type: str) -> bytes | None: ...
 
     @abstractmethod
-    def list_sessions(self) -> list[str]: ...
+    def list_sessions(self, limit: int | None = None) -> list[str]: ...
 
     @abstractmethod
     def get_artifact_path(self, session_id: str, artifact_type: str) -> str | None: ...
+
+    def sessions_fingerprint(self) -> tuple | None:
+        return None
+
+    def artifact_version(self, session_id: str, artifact_type: str) -> int | None:
+        return None
+
+    def load_session_summary(self, session_id: str) -> dict | None:
+        data = self.load_json(session_id, "session")
+        if not data:
+            return None
+        return summarize_session(session_id, data)
@@ -1,9 +1,14 @@
-import json
+import heapq
+import logging
 import os
 from pathlib import Path
 
+import orjson
+
 from core.config import DATA_DIR
-from storage.base import StorageDriver
+from storage.base import StorageDriver, summarize_session
+
+logger = logging.getLogger(__name__)
 
 
 ARTIFACT_FILENAMES = {
@@ -11,6 +16,7 @@ ARTIFACT_FILENAMES = {
     "transcript": "transcript.json",
     "enhanced_resume": "enhanced_resume.json",
     "session": "session.json",
+    "session_summary": "session_summary.json",
     "agent_decisions": "agent_decisions.json",
     "audio": "audio.ogg",
 }
@@ -39,7 +45,11 @@ class LocalStorageDriver(StorageDriver):
     def save_json(self, session_id: str, artifact_type: str, payload: dict) -> str:
         filename = ARTIFACT_FILENAMES.get(artifact_type, f"{artifact_type}.json")
         path = self._session_dir(session_id) / filename
-        path.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+        path.write_bytes(
+            orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
+        if artifact_type == "session":
+            self.save_json(session_id, "session_summary", summarize_session(session_id, payload))
         return str(path)
 
     def load_json(self, session_id: str, artifact_type: str) -> dict | None:
@@ -47,7 +57,33 @@ class LocalStorageDriver(StorageDriver):
         path = self._session_dir(session_id) / filename
         if not path.exists():
             return None
-        return json.loads(path.read_text(encoding="utf-8"))
+        return orjson.loads(path.read_bytes())
+
+    def load_session_summary(self, session_id: str) -> dict | None:
+        # The listing only needs a few shallow fields; read the sidecar instead of the
+        # full transcript. The agent writes session.json directly, so rebuild the
+        # sidecar whenever it is missing or older than the session.
+        session_dir = self._base / session_id
+        sidecar = session_dir / ARTIFACT_FILENAMES["session_summary"]
+        try:
+            session_mtime = (session_dir / ARTIFACT_FILENAMES["session"]).stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+        try:
+            if sidecar.stat().st_mtime_ns >= session_mtime:
+                return orjson.loads(sidecar.read_bytes())
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            pass
+
+        data = self.load_json(session_id, "session")
+        if not data:
+            return None
+        summary = summarize_session(session_id, data)
+        try:
+            sidecar.write_bytes(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
+        except OSError as e:
+            logger.warning("Could not write session summary for %s: %s", session_id, e)
+        return summary
 
     def load_artifact(self, session_id: str, artifact_type: str) -> bytes | None:
         filename = ARTIFACT_FILENAMES.get(artifact_type, artifact_type)
@@ -56,13 +92,38 @@ class LocalStorageDriver(StorageDriver):
             return None
         return path.read_bytes()
 
-    def list_sessions(self) -> list[str]:
+    def list_sessions(self, limit: int | None = None) -> list[str]:
+        # Newest first by session.json mtime: session ids start with the room name,
+        # so name order isn't chronological.
         if not self._base.exists():
             return []
-        return sorted(
-            [d.name for d in self._base.iterdir() if d.is_dir()],
-            reverse=True,
-        )
+        session_file = ARTIFACT_FILENAMES["session"]
+        entries = []
+        with os.scandir(self._base) as it:
+            for entry in it:
+                if not entry.is_dir():
+                    continue
+                try:
+                    mtime = os.stat(os.path.join(entry.path, session_file)).st_mtime_ns
+                except FileNotFoundError:
+                    continue
+                entries.append((mtime, entry.name))
+        if limit is not None:
+            entries = heapq.nlargest(limit, entries)
+        else:
+            entries.sort(reverse=True)
+        return [name for _, name in entries]
+
+    def sessions_fingerprint(self) -> tuple[int, int]:
+        stats = [p.stat() for p in self._base.glob(f"*/{ARTIFACT_FILENAMES['session']}")]
+        return len(stats), max((s.st_mtime_ns for s in stats), default=0)
+
+    def artifact_version(self, session_id: str, artifact_type: str) -> int | None:
+        filename = ARTIFACT_FILENAMES.get(artifact_type, f"{artifact_type}.json")
+        try:
+            return (self._base / session_id / filename).stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
 
     def get_artifact_path(self, session_id: str, artifact_type: str) -> str | None:
         filename = ARTIFACT_FILENAMES.get(artifact_type, artifact_type)
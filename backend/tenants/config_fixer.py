@@ -1,18 +1,17 @@
-import json
 import logging
 from typing import Optional
 
+import orjson
+
+from core.clients import get_gemini_client, get_langfuse_client
+from core.config import GEMINI_MODEL
 from interview_prep.schemas import TenantConfig
 
 logger = logging.getLogger(__name__)
 
-GEMINI_MODEL = "gemini-2.0-flash"
-
 
 def _persist_fixed_config(tenant_id: str, fixed_config: dict) -> None:
     try:
-        from core.clients import get_langfuse_client
-
         client = get_langfuse_client()
         if client is None:
             return
@@ -35,8 +34,6 @@ def _persist_fixed_config(tenant_id: str, fixed_config: dict) -> None:
 
 def fix_tenant_config(raw: dict, tenant_id: str) -> Optional[TenantConfig]:
     try:
-        from core.clients import get_gemini_client
-
         client = get_gemini_client()
         schema = TenantConfig.model_json_schema()
 
@@ -45,8 +42,8 @@ def fix_tenant_config(raw: dict, tenant_id: str) -> Optional[TenantConfig]:
             "and the expected Pydantic schema. Fix the JSON so it conforms to the "
             "schema exactly. Preserve all original values where possible. "
             "Fill in reasonable defaults for any missing required fields.\n\n"
-            f"Expected schema:\n```json\n{json.dumps(schema, indent=2)}\n```\n\n"
-            f"Malformed input:\n```json\n{json.dumps(raw, indent=2)}\n```\n\n"
+            f"Expected schema:\n```json\n{orjson.dumps(schema, option=orjson.OPT_INDENT_2).decode()}\n```\n\n"
+            f"Malformed input:\n```json\n{orjson.dumps(raw, option=orjson.OPT_INDENT_2).decode()}\n```\n\n"
             f"The tenant_id is: {tenant_id}\n\n"
             "Return ONLY the corrected JSON object."
         )
@@ -57,7 +54,7 @@ def fix_tenant_config(raw: dict, tenant_id: str) -> Optional[TenantConfig]:
             config={"temperature": 0.0, "response_mime_type": "application/json"},
         )
 
-        fixed = json.loads(response.text)
+        fixed = orjson.loads(response.text)
         fixed.setdefault("tenant_id", tenant_id)
         config = TenantConfig(**fixed)
         logger.info("Gemini auto-fixed tenant config for %s", tenant_id)
@@ -1,7 +1,9 @@
-import json
 import logging
 from pathlib import Path
 
+import orjson
+
+from core.clients import get_langfuse_client
 from interview_prep.schemas import TenantConfig
 
 logger = logging.getLogger(__name__)
@@ -11,8 +13,6 @@ CONFIGS_DIR = Path(__file__).parent / "configs"
 
 def _load_from_langfuse(tenant_id: str) -> TenantConfig | None:
     try:
-        from core.clients import get_langfuse_client
-
         client = get_langfuse_client()
         if client is None:
             return None
@@ -49,7 +49,7 @@ def _load_from_file(tenant_id: str) -> TenantConfig:
     if not config_path.exists():
         config_path = CONFIGS_DIR / "default.json"
 
-    raw = json.loads(config_path.read_text(encoding="utf-8"))
+    raw = orjson.loads(config_path.read_bytes())
     raw.setdefault("tenant_id", tenant_id)
     return TenantConfig(**raw)
 
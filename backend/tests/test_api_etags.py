@@ -0,0 +1,117 @@
+import os
+
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from storage.local import LocalStorageDriver
+
+
+def _session(room: str, turns: int = 1) -> dict:
+    return {"room_name": room, "transcript": [{"role": "user", "text": "hi"}] * turns}
+
+
+def _rewrite(path, payload: dict, mtime_ns: int) -> None:
+    path.write_bytes(orjson.dumps(payload))
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    storage = LocalStorageDriver(str(tmp_path))
+    monkeypatch.setattr(main, "get_storage", lambda: storage)
+    monkeypatch.setattr(main, "_sessions_cache", {})
+    monkeypatch.setattr(main, "_session_summaries", {})
+    return storage
+
+
+@pytest.fixture
+def client():
+    # No context manager: the lifespan would fetch LiveKit secrets and warm the client.
+    return TestClient(main.app)
+
+
+def _revalidate(client: TestClient, url: str):
+    first = client.get(url)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    second = client.get(url, headers={"If-None-Match": etag})
+    return first, second, etag
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        f"/api/voice-questions?phase={main.PHASES_ORDER[0]}",
+        f"/api/voice-questions?phase={main.PHASES_ORDER[0]}&life_stage=professional",
+        "/api/voice-questions/all",
+        "/api/voice-questions/all?life_stage=student",
+    ],
+)
+def test_voice_questions_revalidate(client, url):
+    first, second, etag = _revalidate(client, url)
+
+    assert second.status_code == 304
+    assert second.headers["etag"] == etag
+    assert second.content == b""
+    assert client.get(url, headers={"If-None-Match": f'W/{etag}, "other"'}).status_code == 304
+    assert client.get(url, headers={"If-None-Match": '"other"'}).status_code == 200
+
+
+def test_session_revalidates_and_changes_with_the_file(client, storage, tmp_path):
+    storage.save_json("s1", "session", _session("room-a"))
+    _, second, etag = _revalidate(client, "/api/sessions/s1")
+    assert second.status_code == 304
+
+    _rewrite(tmp_path / "s1" / "session.json", _session("room-a", turns=2), 2_000_000_000)
+    changed = client.get("/api/sessions/s1", headers={"If-None-Match": etag})
+
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert len(changed.json()["transcript"]) == 2
+
+
+def test_session_etag_changes_when_audio_appears(client, storage):
+    storage.save_json("s1", "session", _session("room-a"))
+    etag = client.get("/api/sessions/s1").headers["etag"]
+
+    storage.save_artifact("s1", "audio", b"OggS", "ogg")
+    response = client.get("/api/sessions/s1", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.json()["audio_available"] is True
+
+
+def test_missing_session_is_404(client, storage):
+    assert client.get("/api/sessions/nope").status_code == 404
+
+
+def test_session_list_revalidates_and_changes_with_the_files(client, storage, tmp_path):
+    storage.save_json("s1", "session", _session("room-a"))
+    _rewrite(tmp_path / "s1" / "session.json", _session("room-a"), 1_000_000_000)
+    _, second, etag = _revalidate(client, "/api/sessions")
+    assert second.status_code == 304
+
+    storage.save_json("s2", "session", _session("room-b"))
+    _rewrite(tmp_path / "s2" / "session.json", _session("room-b"), 2_000_000_000)
+    changed = client.get("/api/sessions", headers={"If-None-Match": etag})
+
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert [s["session_id"] for s in changed.json()["sessions"]] == ["s2", "s1"]
+
+
+def test_session_list_caches_each_limit(client, storage, tmp_path):
+    for sid, mtime in (("s1", 1_000_000_000), ("s2", 2_000_000_000)):
+        storage.save_json(sid, "session", _session(sid))
+        os.utime(tmp_path / sid / "session.json", ns=(mtime, mtime))
+
+    limited = client.get("/api/sessions?limit=1")
+    full = client.get("/api/sessions")
+
+    assert [s["session_id"] for s in limited.json()["sessions"]] == ["s2"]
+    assert [s["session_id"] for s in full.json()["sessions"]] == ["s2", "s1"]
+    assert limited.headers["etag"] != full.headers["etag"]
+    again = client.get("/api/sessions?limit=1", headers={"If-None-Match": limited.headers["etag"]})
+    assert again.status_code == 304
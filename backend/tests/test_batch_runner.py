@@ -0,0 +1,122 @@
+import asyncio
+import contextvars
+
+import pytest
+
+from interview_prep.batch_runner import StageBatcher
+
+request_id: contextvars.ContextVar[str | None] = contextvars.ContextVar("request_id", default=None)
+
+
+def _batcher(batches: list, *, bucket_of=None, max_batch: int = 8, fail_batch: bool = False):
+    async def run_one(state):
+        return {"id": state["id"], "mode": "one", "request_id": request_id.get()}
+
+    async def run_batch(states):
+        batches.append([state["id"] for state in states])
+        if fail_batch:
+            raise RuntimeError("batch failed")
+        return [
+            {"id": state["id"], "mode": "batch", "request_id": request_id.get()}
+            for state in states
+        ]
+
+    return StageBatcher(run_one, run_batch, max_batch=max_batch, bucket_of=bucket_of)
+
+
+async def _submit(batcher: StageBatcher, state: dict, rid: str | None = None):
+    request_id.set(rid)
+    return await asyncio.wait_for(batcher.submit(state), timeout=2)
+
+
+def test_groups_by_bucket_and_returns_each_caller_its_own_update():
+    batches: list = []
+    batcher = _batcher(batches, bucket_of=lambda state: state["tenant"])
+    states = [{"id": i, "tenant": "a" if i % 2 else "b"} for i in range(6)]
+
+    async def run():
+        return await asyncio.gather(*(_submit(batcher, state) for state in states))
+
+    updates = asyncio.run(run())
+
+    assert [update["id"] for update in updates] == list(range(6))
+    assert all(update["mode"] == "batch" for update in updates)
+    assert sorted(map(sorted, batches)) == [[0, 2, 4], [1, 3, 5]]
+
+
+def test_respects_max_batch():
+    batches: list = []
+    batcher = _batcher(batches, max_batch=2)
+
+    async def run():
+        return await asyncio.gather(*(_submit(batcher, {"id": i}) for i in range(4)))
+
+    updates = asyncio.run(run())
+
+    assert [update["id"] for update in updates] == [0, 1, 2, 3]
+    assert all(len(batch) <= 2 for batch in batches)
+
+
+def test_batch_error_fails_every_member():
+    batcher = _batcher([], fail_batch=True)
+
+    async def run():
+        return await asyncio.gather(
+            *(_submit(batcher, {"id": i}) for i in range(3)), return_exceptions=True
+        )
+
+    results = asyncio.run(run())
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_bucket_error_fails_callers_instead_of_hanging():
+    def bucket_of(state):
+        raise KeyError("tenant_config")
+
+    batcher = _batcher([], bucket_of=bucket_of)
+
+    async def run():
+        first = await asyncio.gather(_submit(batcher, {"id": 0}), return_exceptions=True)
+        second = await asyncio.gather(_submit(batcher, {"id": 1}), return_exceptions=True)
+        return first + second
+
+    results = asyncio.run(run())
+
+    assert all(isinstance(result, KeyError) for result in results)
+
+
+def test_single_dispatch_runs_in_submitter_context_only():
+    batcher = _batcher([])
+
+    async def run():
+        first = await _submit(batcher, {"id": 0}, rid="first")
+        second = await _submit(batcher, {"id": 1}, rid="second")
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert (first["mode"], first["request_id"]) == ("one", "first")
+    assert (second["mode"], second["request_id"]) == ("one", "second")
+
+
+def test_batched_dispatch_does_not_inherit_first_submitter_context():
+    batcher = _batcher([])
+
+    async def run():
+        return await asyncio.gather(
+            _submit(batcher, {"id": 0}, rid="first"),
+            _submit(batcher, {"id": 1}, rid="second"),
+        )
+
+    updates = asyncio.run(run())
+
+    assert [update["mode"] for update in updates] == ["batch", "batch"]
+    assert [update["request_id"] for update in updates] == [None, None]
+
+
+@pytest.fixture(autouse=True)
+def _reset_request_id():
+    token = request_id.set(None)
+    yield
+    request_id.reset(token)
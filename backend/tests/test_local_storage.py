@@ -0,0 +1,100 @@
+import os
+from pathlib import Path
+
+import orjson
+import pytest
+
+from storage.local import LocalStorageDriver
+
+
+def _session(room: str, turns: int = 1) -> dict:
+    return {
+        "room_name": room,
+        "timestamp": "2026-01-01T00:00:00",
+        "duration": {"formatted": "1:00"},
+        "transcript": [{"role": "user", "text": "hi"}] * turns,
+    }
+
+
+def _touch(path: Path, mtime_ns: int) -> None:
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return LocalStorageDriver(str(tmp_path))
+
+
+def test_summary_is_read_from_sidecar(storage, tmp_path):
+    storage.save_json("s1", "session", _session("room-a", turns=2))
+
+    assert storage.load_session_summary("s1")["transcript_count"] == 2
+    assert (tmp_path / "s1" / "session_summary.json").exists()
+
+
+def test_stale_sidecar_is_rebuilt(storage, tmp_path):
+    storage.save_json("s1", "session", _session("room-a", turns=1))
+    # The agent rewrites session.json directly, without refreshing the sidecar.
+    session_file = tmp_path / "s1" / "session.json"
+    session_file.write_bytes(orjson.dumps(_session("room-a", turns=3)))
+    _touch(tmp_path / "s1" / "session_summary.json", 1_000)
+    _touch(session_file, 2_000)
+
+    assert storage.load_session_summary("s1")["transcript_count"] == 3
+    sidecar = orjson.loads((tmp_path / "s1" / "session_summary.json").read_bytes())
+    assert sidecar["transcript_count"] == 3
+
+
+def test_missing_sidecar_is_rebuilt(storage, tmp_path):
+    storage.save_json("s1", "session", _session("room-a"))
+    (tmp_path / "s1" / "session_summary.json").unlink()
+
+    assert storage.load_session_summary("s1")["room_name"] == "room-a"
+    assert (tmp_path / "s1" / "session_summary.json").exists()
+
+
+def test_unwritable_sidecar_still_returns_summary(storage, tmp_path, monkeypatch):
+    session_dir = tmp_path / "s1"
+    session_dir.mkdir()
+    (session_dir / "session.json").write_bytes(orjson.dumps(_session("room-a", turns=2)))
+    write_bytes = Path.write_bytes
+
+    def read_only(path, data):
+        if path.name == "session_summary.json":
+            raise PermissionError(13, "Read-only file system", str(path))
+        return write_bytes(path, data)
+
+    monkeypatch.setattr(Path, "write_bytes", read_only)
+
+    assert storage.load_session_summary("s1")["transcript_count"] == 2
+    assert not (session_dir / "session_summary.json").exists()
+
+
+def test_missing_session_has_no_summary(storage):
+    assert storage.load_session_summary("nope") is None
+
+
+def test_list_sessions_newest_first_by_session_mtime(storage, tmp_path):
+    for sid, mtime in (("b-room", 3_000), ("a-room", 1_000), ("c-room", 2_000)):
+        storage.save_json(sid, "session", _session(sid))
+        _touch(tmp_path / sid / "session.json", mtime)
+    (tmp_path / "no-session").mkdir()
+
+    assert storage.list_sessions() == ["b-room", "c-room", "a-room"]
+    assert storage.list_sessions(limit=2) == ["b-room", "c-room"]
+    assert storage.list_sessions(limit=10) == ["b-room", "c-room", "a-room"]
+
+
+def test_fingerprint_and_version_track_session_writes(storage, tmp_path):
+    storage.save_json("s1", "session", _session("room-a"))
+    _touch(tmp_path / "s1" / "session.json", 1_000)
+    before = storage.sessions_fingerprint()
+    version = storage.artifact_version("s1", "session")
+
+    storage.save_json("s2", "session", _session("room-b"))
+    _touch(tmp_path / "s2" / "session.json", 2_000)
+    assert storage.sessions_fingerprint() != before
+
+    _touch(tmp_path / "s1" / "session.json", 3_000)
+    assert storage.artifact_version("s1", "session") != version
+    assert storage.artifact_version("nope", "session") is None
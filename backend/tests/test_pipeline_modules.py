@@ -3,10 +3,15 @@ Module-level tests for the interview prep pipeline.
 Each module is tested in isolation with timing measurements.
 Usage: cd backend && python -m tests.test_pipeline_modules
 """
+import asyncio
 import json
 import sys
 import time
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from interview_prep.schemas import InterviewBriefing, InterviewPlan, ProfileAnalysis
 
 RESUME_PATH = Path(__file__).resolve().parents[2] / "Francesco_Angeli_resume (6).pdf"
 PASS = "\033[92mPASS\033[0m"
@@ -67,7 +72,7 @@ def test_resume_parser() -> dict | None:
         return None
 
 
-def test_profile_analyzer(resume_data: dict) -> dict | None:
+async def test_profile_analyzer(resume_data: dict) -> "ProfileAnalysis | None":
     _header("2. Profile Analyzer (Gemini 2.0 Flash)")
 
     from interview_prep.agents.profile_analyzer import profile_analyzer_node
@@ -86,15 +91,12 @@ def test_profile_analyzer(resume_data: dict) -> dict | None:
             "position_id": "senior_ml_engineer",
             "position_title": "Senior ML Engineer",
         },
-        "profile_analysis": None,
-        "interview_plan": None,
-        "interview_briefing": None,
         "errors": [],
     }
 
     start = time.time()
     try:
-        result = profile_analyzer_node(state)
+        result = await profile_analyzer_node(state)
         elapsed = time.time() - start
 
         pa = result.get("profile_analysis")
@@ -105,8 +107,8 @@ def test_profile_analyzer(resume_data: dict) -> dict | None:
                 "profile_analyzer",
                 elapsed,
                 True,
-                f"domain={pa.get('domain')}, strengths={len(pa.get('strengths', []))}, "
-                f"gaps={len(pa.get('gaps', []))}, hooks={len(pa.get('interesting_hooks', []))}",
+                f"domain={pa.domain}, strengths={len(pa.strengths)}, "
+                f"gaps={len(pa.gaps)}, hooks={len(pa.interesting_hooks)}",
             )
             return pa
         else:
@@ -119,7 +121,9 @@ def test_profile_analyzer(resume_data: dict) -> dict | None:
         return None
 
 
-def test_question_planner(resume_data: dict, profile_analysis: dict) -> dict | None:
+async def test_question_planner(
+    resume_data: dict, profile_analysis: "ProfileAnalysis"
+) -> "InterviewPlan | None":
     _header("3. Question Planner (Gemini 2.0 Flash)")
 
     from interview_prep.agents.question_planner import question_planner_node
@@ -141,28 +145,26 @@ def test_question_planner(resume_data: dict, profile_analysis: dict) -> dict | N
             "position_title": "Senior ML Engineer",
         },
         "profile_analysis": profile_analysis,
-        "interview_plan": None,
-        "interview_briefing": None,
         "errors": [],
     }
 
     start = time.time()
     try:
-        result = question_planner_node(state)
+        result = await question_planner_node(state)
         elapsed = time.time() - start
 
         ip = result.get("interview_plan")
         errors = result.get("errors", [])
 
         if ip:
-            phases = ip.get("phases", [])
-            total_q = sum(len(p.get("questions", [])) for p in phases)
+            phases = ip.phases
+            total_q = sum(len(p.questions) for p in phases)
             _report(
                 "question_planner",
                 elapsed,
                 True,
                 f"phases={len(phases)}, questions={total_q}, "
-                f"duration={ip.get('total_estimated_duration')}",
+                f"duration={ip.total_estimated_duration}",
             )
             return ip
         else:
@@ -175,9 +177,9 @@ def test_question_planner(resume_data: dict, profile_analysis: dict) -> dict | N
         return None
 
 
-def test_interview_briefer(
-    resume_data: dict, profile_analysis: dict, interview_plan: dict
-) -> dict | None:
+async def test_interview_briefer(
+    resume_data: dict, profile_analysis: "ProfileAnalysis", interview_plan: "InterviewPlan"
+) -> "InterviewBriefing | None":
     _header("4. Interview Briefer (Gemini 2.0 Flash)")
 
     from interview_prep.agents.interview_briefer import interview_briefer_node
@@ -200,13 +202,12 @@ def test_interview_briefer(
         },
         "profile_analysis": profile_analysis,
         "interview_plan": interview_plan,
-        "interview_briefing": None,
         "errors": [],
     }
 
     start = time.time()
     try:
-        result = interview_briefer_node(state)
+        result = await interview_briefer_node(state)
         elapsed = time.time() - start
 
         ib = result.get("interview_briefing")
@@ -217,8 +218,8 @@ def test_interview_briefer(
                 "interview_briefer",
                 elapsed,
                 True,
-                f"questions={len(ib.get('questions_script', []))}, "
-                f"hints={len(ib.get('personalization_hints', []))}",
+                f"questions={len(ib.questions_script)}, "
+                f"hints={len(ib.personalization_hints)}",
             )
             return ib
         else:
@@ -231,7 +232,7 @@ def test_interview_briefer(
         return None
 
 
-def main() -> None:
+async def run_modules() -> None:
     print("\n" + "=" * 60)
     print("  PIPELINE MODULE TESTS")
     print(f"  Resume: {RESUME_PATH.name}")
@@ -249,7 +250,7 @@ def main() -> None:
         sys.exit(1)
 
     t0 = time.time()
-    profile_analysis = test_profile_analyzer(resume_data)
+    profile_analysis = await test_profile_analyzer(resume_data)
     timings["profile_analyzer"] = time.time() - t0
 
     if not profile_analysis:
@@ -257,7 +258,7 @@ def main() -> None:
         sys.exit(1)
 
     t0 = time.time()
-    interview_plan = test_question_planner(resume_data, profile_analysis)
+    interview_plan = await test_question_planner(resume_data, profile_analysis)
     timings["question_planner"] = time.time() - t0
 
     if not interview_plan:
@@ -265,7 +266,7 @@ def main() -> None:
         sys.exit(1)
 
     t0 = time.time()
-    interview_briefing = test_interview_briefer(
+    interview_briefing = await test_interview_briefer(
         resume_data, profile_analysis, interview_plan
     )
     timings["interview_briefer"] = time.time() - t0
@@ -287,5 +288,10 @@ def main() -> None:
         sys.exit(1)
 
 
+def main() -> None:
+    # One event loop for all nodes: the shared Gemini client and semaphore are loop-bound.
+    asyncio.run(run_modules())
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,162 @@
+import asyncio
+import math
+import types
+
+import pytest
+
+from interview_prep import cache as cache_module
+from interview_prep.agents.profile_analyzer import PROFILE_CACHE_SIMILARITY, _profile_cache_namespace
+from interview_prep.cache import SemanticCache, canonical_json
+
+RESUME = {"basics": {"name": "Ana Díaz", "email": "ana@example.com"}, "work": [{"name": "Acme"}]}
+
+
+def _unit(cosine: float) -> tuple[float, ...]:
+    # A unit vector whose cosine with (1, 0) is `cosine`.
+    return cosine, math.sqrt(1 - cosine * cosine)
+
+
+def _resume(company: str) -> dict:
+    return {**RESUME, "work": [{"name": company}]}
+
+
+def _state(user_name: str = "Ana Díaz", resume: dict = RESUME, tenant_config: dict | None = None):
+    return {
+        "resume_data": resume,
+        "user_name": user_name,
+        "life_stage": "professional",
+        "tenant_config": tenant_config,
+    }
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module, "time", types.SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+@pytest.fixture
+def embeddings():
+    return {}
+
+
+@pytest.fixture
+def embed_calls():
+    return []
+
+
+@pytest.fixture
+def cache(monkeypatch, embeddings, embed_calls, clock):
+    cache = SemanticCache(threshold=PROFILE_CACHE_SIMILARITY, max_entries=8, ttl_seconds=60)
+
+    async def embed(document: bytes):
+        embed_calls.append(document)
+        return embeddings.get(document)
+
+    monkeypatch.setattr(cache, "_embed", embed)
+    return cache
+
+
+async def _store(cache: SemanticCache, namespace: str, data: dict, value) -> None:
+    probe = await cache.lookup(namespace, data)
+    cache.store(probe, value)
+    await asyncio.gather(*cache._backfills)
+
+
+def test_exact_hit_skips_embedding(cache, embeddings, embed_calls):
+    embeddings[canonical_json(RESUME)] = _unit(1.0)
+
+    async def run():
+        await _store(cache, "ns", RESUME, "analysis")
+        embed_calls.clear()
+        return await cache.lookup("ns", dict(reversed(list(RESUME.items()))))
+
+    probe = asyncio.run(run())
+
+    assert probe.value == "analysis"
+    assert embed_calls == []
+
+
+def test_first_lookup_in_namespace_defers_embedding_to_store(cache, embeddings, embed_calls):
+    embeddings[canonical_json(RESUME)] = _unit(1.0)
+
+    async def run():
+        probe = await cache.lookup("ns", RESUME)
+        assert probe.embedding is None and embed_calls == []
+        await _store(cache, "ns", RESUME, "analysis")
+
+    asyncio.run(run())
+
+    assert [entry.embedding for entry in cache._entries.values()] == [_unit(1.0)]
+
+
+def test_entries_expire_after_ttl(cache, clock):
+    async def run():
+        await _store(cache, "ns", RESUME, "analysis")
+        clock[0] += 61
+        return await cache.lookup("ns", RESUME)
+
+    probe = asyncio.run(run())
+
+    assert probe.value is None
+    assert not cache._entries
+
+
+@pytest.mark.parametrize(
+    ("cosine", "hit"),
+    [(PROFILE_CACHE_SIMILARITY + 0.01, True), (PROFILE_CACHE_SIMILARITY - 0.01, False)],
+)
+def test_near_hit_threshold(cache, embeddings, cosine, hit):
+    stored, edited = _resume("Acme"), _resume("Acme Corp")
+    embeddings[canonical_json(stored)] = _unit(1.0)
+    embeddings[canonical_json(edited)] = _unit(cosine)
+
+    async def run():
+        await _store(cache, "ns", stored, "analysis")
+        return await cache.lookup("ns", edited)
+
+    probe = asyncio.run(run())
+
+    assert (probe.value == "analysis") is hit
+
+
+def test_without_embeddings_only_exact_hits_are_served(cache):
+    async def run():
+        await _store(cache, "ns", _resume("Acme"), "analysis")
+        near = await cache.lookup("ns", _resume("Acme Corp"))
+        exact = await cache.lookup("ns", _resume("Acme"))
+        return near, exact
+
+    near, exact = asyncio.run(run())
+
+    assert near.value is None and near.embedding is None
+    assert exact.value == "analysis"
+
+
+@pytest.mark.parametrize(
+    "other",
+    [
+        _state(user_name="Bruno Paz"),
+        _state(resume={**RESUME, "basics": {"name": "Bruno Paz", "email": "bruno@example.com"}}),
+        _state(tenant_config={"tone": "formal", "focus_area": "Engineering"}),
+    ],
+    ids=["other-user", "other-candidate", "other-tenant"],
+)
+def test_namespaces_isolate_candidates_and_tenants(cache, embeddings, other):
+    own = _state()
+    embeddings[canonical_json(own["resume_data"])] = _unit(1.0)
+    embeddings[canonical_json(other["resume_data"])] = _unit(1.0)
+
+    async def run():
+        await _store(cache, _profile_cache_namespace(own), own["resume_data"], "analysis")
+        return (
+            await cache.lookup(_profile_cache_namespace(own), own["resume_data"]),
+            await cache.lookup(_profile_cache_namespace(other), other["resume_data"]),
+        )
+
+    same, different = asyncio.run(run())
+
+    assert _profile_cache_namespace(own) != _profile_cache_namespace(other)
+    assert same.value == "analysis"
+    assert different.value is None
@@ -0,0 +1,77 @@
+import jwt
+import pytest
+from livekit import api
+
+from core import tokens
+from core.config import livekit_api_key, livekit_api_secret
+
+API_KEY = "APIkey123"
+API_SECRET = "a-livekit-api-secret-long-enough-for-hs256"
+
+
+def _access_token(identity: str, name: str, room: str, secret: str = API_SECRET) -> str:
+    return (
+        api.AccessToken(API_KEY, secret)
+        .with_identity(identity)
+        .with_name(name)
+        .with_grants(
+            api.VideoGrants(
+                room_join=True,
+                room=room,
+                can_publish=True,
+                can_subscribe=True,
+                can_publish_data=True,
+            )
+        )
+        .to_jwt()
+    )
+
+
+def _decode(token: str, secret: str = API_SECRET) -> dict:
+    return jwt.decode(token, secret, algorithms=["HS256"], options={"verify_nbf": False})
+
+
+@pytest.fixture(autouse=True)
+def _livekit_credentials(monkeypatch):
+    monkeypatch.setenv("LIVEKIT_API_KEY", API_KEY)
+    monkeypatch.setenv("LIVEKIT_API_SECRET", API_SECRET)
+    livekit_api_key.cache_clear()
+    livekit_api_secret.cache_clear()
+    yield
+    livekit_api_key.cache_clear()
+    livekit_api_secret.cache_clear()
+
+
+def test_matches_access_token_claims():
+    ours = tokens.room_join_token(identity="user-1", name="Ana Díaz", room="room-1")
+    theirs = _access_token("user-1", "Ana Díaz", "room-1")
+
+    assert jwt.get_unverified_header(ours) == jwt.get_unverified_header(theirs)
+    ours_claims, theirs_claims = _decode(ours), _decode(theirs)
+    assert abs(ours_claims.pop("nbf") - theirs_claims.pop("nbf")) <= 2
+    assert abs(ours_claims.pop("exp") - theirs_claims.pop("exp")) <= 2
+    assert ours_claims == theirs_claims
+
+
+def test_verifies_with_livekit_token_verifier():
+    token = tokens.room_join_token(identity="user-1", name="Ana", room="room-1")
+
+    claims = api.TokenVerifier(API_KEY, API_SECRET).verify(token)
+
+    assert claims.identity == "user-1"
+    assert claims.name == "Ana"
+    assert claims.video.room == "room-1"
+    assert claims.video.room_join and claims.video.can_publish_data
+
+
+def test_rotated_secret_is_used(monkeypatch):
+    tokens.room_join_token(identity="user-1", name="Ana", room="room-1")
+    rotated = "a-rotated-livekit-api-secret-for-hs256"
+    monkeypatch.setenv("LIVEKIT_API_SECRET", rotated)
+    livekit_api_secret.cache_clear()
+
+    token = tokens.room_join_token(identity="user-1", name="Ana", room="room-1")
+
+    assert _decode(token, rotated)["sub"] == "user-1"
+    with pytest.raises(jwt.InvalidSignatureError):
+        _decode(token)